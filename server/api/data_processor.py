@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
 import numpy as np
+import functools
 import hashlib
-import json
-import torch
+import hmac
+import os
 import re
-from typing import Dict, List, Tuple, Any, Optional, Union
+import secrets
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Set, Tuple, Any, Optional, Union
+
+if TYPE_CHECKING:
+    import torch
+
+# Numba is optional; without it the feature kernels run as plain Python loops
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# orjson is optional; it parses str or bytes several times faster than json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 """
 This module handles the preparation, anonymization, and preprocessing of data
@@ -15,11 +40,27 @@ utilities for converting Azure DevOps work items and dependencies into formats
 suitable for PINN training.
 """
 
+# Batches larger than this are hashed on a thread pool
+PARALLEL_HASH_THRESHOLD = 1024
+
+# Columns of the (N, 9) feature buffer that form the model inputs and outputs
+X_COLS = np.array([0, 1, 3, 4, 6, 7])
+Y_COLS = np.array([2, 5, 8])
+
+
 class GDPRCompliantProcessor:
     """
     Handles GDPR-compliant data processing including anonymization and opt-out management.
     """
-    def __init__(self, anonymize_fields=None, salt=None):
+    anonymize_fields: List[str]
+    salt: str
+    opt_out_users: Set[str]
+    _anon_fields_set: Set[str]
+    _salt_bytes: bytes
+    _hmac_base: "hmac.HMAC"
+    _cached_hash: Callable[[str], str]
+    
+    def __init__(self, anonymize_fields: Optional[List[str]] = None, salt: Optional[str] = None):
         """
         Initialize the GDPR-compliant processor.
         
@@ -30,16 +71,24 @@ class GDPRCompliantProcessor:
         self.anonymize_fields = anonymize_fields or [
             "title", "description", "assignedTo", "createdBy"
         ]
+        self._anon_fields_set = set(self.anonymize_fields)
         self.salt = salt or self._generate_salt()
         self.opt_out_users = set()
         
+        # Keyed once; each hash copies this state instead of re-deriving the HMAC pads
+        self._salt_bytes = self.salt.encode()
+        self._hmac_base = hmac.new(self._salt_bytes, digestmod=hashlib.sha256)
+        
+        # The same people and titles recur across many work items, so memoize hashes
+        self._cached_hash = functools.lru_cache(maxsize=1 << 16)(self._hash_value)
+        
     def _generate_salt(self) -> str:
         """Generate a random salt for hashing."""
-        return hashlib.sha256(str(np.random.rand()).encode()).hexdigest()[:16]
+        return secrets.token_hex(8)
     
     def anonymize_value(self, value: str) -> str:
         """
-        Anonymize a value using SHA-3 hashing.
+        Anonymize a value using HMAC-SHA256 keyed with the salt.
         
         Args:
             value: Value to anonymize
@@ -47,12 +96,40 @@ class GDPRCompliantProcessor:
         Returns:
             Anonymized hash value
         """
-        if not value:
-            return ""
+        return self._cached_hash(value) if value else ""
+    
+    def _hash_value(self, value: str) -> str:
+        """Hash a value with HMAC-SHA256 (hardware-accelerated via OpenSSL where available)."""
+        mac = self._hmac_base.copy()
+        mac.update(value.encode())
+        return mac.hexdigest()
+    
+    def anonymize_values_batch(self, values: List[str]) -> List[str]:
+        """
+        Anonymize a batch of values in a single pass.
+        
+        Args:
+            values: Values to anonymize
             
-        # Use SHA-3 (SHA-256) for hashing
-        salted_value = f"{value}{self.salt}"
-        return hashlib.sha3_256(salted_value.encode()).hexdigest()
+        Returns:
+            Anonymized hash values in the same order as the input
+        """
+        if len(values) <= PARALLEL_HASH_THRESHOLD:
+            return self._hash_chunk(values)
+            
+        # hashlib releases the GIL while hashing large inputs (e.g. long descriptions),
+        # so spread big batches over a thread pool. Executor.map ignores chunksize
+        # for threads, hence the explicit chunking.
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(values) // (4 * workers))
+        chunks = [values[i:i + chunksize] for i in range(0, len(values), chunksize)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [hashed for chunk in executor.map(self._hash_chunk, chunks) for hashed in chunk]
+    
+    def _hash_chunk(self, values: List[str]) -> List[str]:
+        """Anonymize a list of values sequentially through the hash cache."""
+        cached_hash: Callable[[str], str] = self._cached_hash
+        return [cached_hash(value) if value else "" for value in values]
     
     def anonymize_work_item(self, work_item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -64,13 +141,36 @@ class GDPRCompliantProcessor:
         Returns:
             Anonymized work item
         """
-        anonymized_item = work_item.copy()
+        anon_fields: Set[str] = self._anon_fields_set
+        return {
+            key: self.anonymize_value(str(value)) if value and key in anon_fields else value
+            for key, value in work_item.items()
+        }
+    
+    def anonymize_work_items(self, work_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Anonymize sensitive fields in many work items, hashing all values in one batch.
         
-        for field in self.anonymize_fields:
-            if field in anonymized_item and anonymized_item[field]:
-                anonymized_item[field] = self.anonymize_value(str(anonymized_item[field]))
-                
-        return anonymized_item
+        Args:
+            work_items: List of work item dictionaries
+            
+        Returns:
+            Anonymized work items, in the same order as the input
+        """
+        anon_fields: Set[str] = self._anon_fields_set
+        anonymized_work_items = [dict(item) for item in work_items]
+        targets: List[Tuple[Dict[str, Any], str]] = []
+        values: List[str] = []
+        for item in anonymized_work_items:
+            for key, value in item.items():
+                if value and key in anon_fields:
+                    targets.append((item, key))
+                    values.append(str(value))
+        
+        for (item, key), hashed in zip(targets, self.anonymize_values_batch(values)):
+            item[key] = hashed
+        
+        return anonymized_work_items
     
     def register_opt_out(self, user_id: str) -> None:
         """
@@ -91,10 +191,11 @@ class GDPRCompliantProcessor:
         Returns:
             Filtered list without opt-out users' data
         """
-        return [
-            item for item in work_items 
-            if "assignedTo" not in item or item["assignedTo"] not in self.opt_out_users
-        ]
+        opt_out_users: Set[str] = self.opt_out_users
+        if not opt_out_users:
+            return list(work_items)
+            
+        return [item for item in work_items if item.get("assignedTo") not in opt_out_users]
     
     def process_dataset(self, work_items: List[Dict[str, Any]], 
                        dependencies: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -111,11 +212,11 @@ class GDPRCompliantProcessor:
         # Remove opted-out users
         filtered_work_items = self.remove_opt_out_data(work_items)
         
-        # Anonymize remaining items
-        anonymized_work_items = [self.anonymize_work_item(item) for item in filtered_work_items]
+        # Anonymize copies of the remaining items, hashing all values in one batch
+        anonymized_work_items = self.anonymize_work_items(filtered_work_items)
         
         # Filter dependencies to only include remaining work items
-        valid_ids = {item["id"] for item in anonymized_work_items}
+        valid_ids: Set[Any] = {item["id"] for item in anonymized_work_items}
         filtered_dependencies = [
             dep for dep in dependencies
             if dep["sourceId"] in valid_ids and dep["targetId"] in valid_ids
@@ -124,6 +225,138 @@ class GDPRCompliantProcessor:
         return anonymized_work_items, filtered_dependencies
 
 
+_SPRINT_RE = re.compile(r'Sprint (\d+)')
+
+
+def _parse_sprint(sprint: str) -> int:
+    """
+    Parse the sprint number out of a sprint name such as "Sprint 12".
+    
+    Args:
+        sprint: Sprint name
+        
+    Returns:
+        Sprint number, or 0 if the name contains none
+    """
+    # Fast path for the common "Sprint <n>" form
+    if sprint.startswith("Sprint ") and sprint[7:].isdecimal():
+        return int(sprint[7:])
+    sprint_match = _SPRINT_RE.search(sprint)
+    return int(sprint_match.group(1)) if sprint_match else 0
+
+
+# Feature kernels
+#
+# The extractors project work item dictionaries onto flat NumPy columns once
+# and run these kernels over them. With Numba installed they are compiled to
+# parallel machine code; otherwise they run as plain Python loops.
+
+def _pack_work_items(work_items: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Project work item dictionaries onto flat NumPy columns.
+    
+    Args:
+        work_items: List of work item dictionaries
+        
+    Returns:
+        Tuple of (sprint_num, story_points, risk, team_idx, teams) where
+        team_idx indexes into the teams list
+    """
+    n = len(work_items)
+    team_index = {}
+    
+    # Sprint names repeat across items, so parse each distinct name only once
+    sprints = [item.get("sprint", "Sprint 0") for item in work_items]
+    sprint_numbers = {sprint: _parse_sprint(sprint) for sprint in set(sprints)}
+    
+    # Fill each column straight from a generator into a preallocated array
+    sprint_num = np.fromiter((sprint_numbers[sprint] for sprint in sprints), dtype=np.int32, count=n)
+    story_points = np.fromiter((item.get("storyPoints", 3) for item in work_items), dtype=np.float64, count=n)
+    risk = np.fromiter((item.get("riskScore", 50) for item in work_items), dtype=np.float64, count=n)
+    team_idx = np.fromiter(
+        (team_index.setdefault(item.get("team", ""), len(team_index)) for item in work_items),
+        dtype=np.int32, count=n
+    )
+        
+    return sprint_num, story_points, risk, team_idx, list(team_index)
+
+
+@njit(fastmath=True, cache=True)
+def _brooks_row(out, i, sprint_num, team_idx, team_size_by_team, productivity_by_team):
+    """Write the [time, people, productivity] row for work item i."""
+    team = team_idx[i]
+    out[i, 0] = sprint_num[i] / 20.0  # Normalize to [0,1] assuming max 20 sprints
+    out[i, 1] = team_size_by_team[team] / 20.0  # Normalize to [0,1] assuming max 20 people
+    out[i, 2] = productivity_by_team[team]
+
+
+@njit(fastmath=True, cache=True)
+def _critical_chain_row(out, i, story_points, risk, max_dependency_risk, has_dependencies):
+    """Write the [duration, buffer, effective_duration] row for work item i."""
+    nominal_duration = story_points[i] / 13.0  # Normalize to [0,1] assuming max 13 points
+    
+    # Higher risk on incoming dependencies = lower buffer
+    if has_dependencies[i]:
+        buffer = 0.3 * (1.0 - max_dependency_risk[i])
+    else:
+        buffer = 0.3  # Default buffer
+        
+    out[i, 0] = nominal_duration
+    out[i, 1] = buffer
+    out[i, 2] = nominal_duration * (1.0 + risk[i] / 100.0)
+
+
+@njit(fastmath=True, cache=True)
+def _dependency_row(out, i, sprint_num, depth, risk):
+    """Write the [time, dependency_depth, delay] row for work item i."""
+    out[i, 0] = sprint_num[i] / 20.0  # Normalize to [0,1] assuming max 20 sprints
+    out[i, 1] = depth[i] / 10.0  # Normalize to [0,1] assuming max depth of 10
+    out[i, 2] = risk[i] / 100.0  # Normalize to [0,1]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _brooks_kernel(sprint_num, team_idx, team_size_by_team, productivity_by_team):
+    """Compute the Brooks' Law feature matrix."""
+    out = np.empty((sprint_num.shape[0], 3), dtype=np.float32)
+    for i in prange(out.shape[0]):
+        _brooks_row(out, i, sprint_num, team_idx, team_size_by_team, productivity_by_team)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _critical_chain_kernel(story_points, risk, max_dependency_risk, has_dependencies):
+    """Compute the Critical Chain feature matrix."""
+    out = np.empty((story_points.shape[0], 3), dtype=np.float32)
+    for i in prange(out.shape[0]):
+        _critical_chain_row(out, i, story_points, risk, max_dependency_risk, has_dependencies)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _dependency_kernel(sprint_num, depth, risk):
+    """Compute the Dependency Propagation feature matrix."""
+    out = np.empty((sprint_num.shape[0], 3), dtype=np.float32)
+    for i in prange(out.shape[0]):
+        _dependency_row(out, i, sprint_num, depth, risk)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _all_features_kernel(sprint_num, story_points, risk, team_idx, team_size_by_team,
+                         productivity_by_team, max_dependency_risk, has_dependencies, depth):
+    """Compute all three feature matrices into one (N, 9) buffer in a single pass."""
+    n = sprint_num.shape[0]
+    features = np.empty((n, 9), dtype=np.float32)
+    brooks = features[:, 0:3]
+    critical = features[:, 3:6]
+    dependency = features[:, 6:9]
+    for i in prange(n):
+        _brooks_row(brooks, i, sprint_num, team_idx, team_size_by_team, productivity_by_team)
+        _critical_chain_row(critical, i, story_points, risk, max_dependency_risk, has_dependencies)
+        _dependency_row(dependency, i, sprint_num, depth, risk)
+    return features
+
+
 class PINNDataPreprocessor:
     """
     Prepares data for PINN training, including feature extraction and normalization.
@@ -138,42 +371,128 @@ class PINNDataPreprocessor:
         self.gdpr_processor = gdpr_processor or GDPRCompliantProcessor()
         self.feature_ranges = {}
         
-    def extract_brooks_law_features(self, work_items: List[Dict[str, Any]], 
-                                   team_velocities: List[Dict[str, Any]]) -> np.ndarray:
+    def _team_features(self, work_items: List[Dict[str, Any]], teams: List[str],
+                       team_velocities: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Extract features relevant to Brooks' Law PDE.
+        Compute per-team size and productivity, indexed like the teams list.
         
         Args:
             work_items: List of work item dictionaries
+            teams: Team names as returned by _pack_work_items
             team_velocities: Team velocity data
             
         Returns:
-            Array of [time, people, productivity] features
+            Tuple of (team_size_by_team, productivity_by_team)
         """
-        features = []
-        
-        for item in work_items:
-            # Time feature (normalized to sprint)
-            sprint_match = re.search(r'Sprint (\d+)', item.get("sprint", "Sprint 0"))
-            sprint_num = int(sprint_match.group(1)) if sprint_match else 0
-            time_feature = sprint_num / 20  # Normalize to [0,1] assuming max 20 sprints
+        # People feature (team size or assigned resources) from a single sweep
+        team_to_assignees = defaultdict(set)
+        for wi in work_items:
+            team_to_assignees[wi.get("team", "")].add(wi.get("assignedTo", ""))
+        team_size_by_team = np.array([len(team_to_assignees[team]) for team in teams], dtype=np.float32)
+        
+        # Productivity feature (completed story points per sprint)
+        team_data_map = {}
+        for t in team_velocities:
+            team_data_map.setdefault(t["team"], t)
             
-            # People feature (team size or assigned resources)
-            team = item.get("team", "")
-            team_data = next((t for t in team_velocities if t["team"] == team), None)
-            team_size = len(set(wi.get("assignedTo", "") for wi in work_items if wi.get("team", "") == team))
-            people_feature = team_size / 20  # Normalize to [0,1] assuming max 20 people
-            
-            # Productivity feature (completed story points per sprint)
+        productivity_by_team = np.empty(len(teams), dtype=np.float32)
+        for k, team in enumerate(teams):
+            team_data = team_data_map.get(team)
             if team_data and team_data.get("sprints"):
                 last_sprint = team_data["sprints"][-1]
-                productivity = last_sprint.get("completed", 0) / max(last_sprint.get("planned", 1), 1)
+                productivity_by_team[k] = last_sprint.get("completed", 0) / max(last_sprint.get("planned", 1), 1)
             else:
-                productivity = 0.5  # Default
+                productivity_by_team[k] = 0.5  # Default
+                
+        return team_size_by_team, productivity_by_team
+    
+    def _max_dependency_risk(self, work_items: List[Dict[str, Any]],
+                             dependencies: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the highest incoming dependency risk of each work item.
+        
+        Args:
+            work_items: List of work item dictionaries
+            dependencies: List of dependency dictionaries
+            
+        Returns:
+            Tuple of (max_dependency_risk, has_dependencies) arrays aligned with work_items
+        """
+        # Reduce the dependencies to one maximum per target in a single pass
+        max_risk_by_target = {}
+        for dep in dependencies:
+            risk = dep.get("riskScore", 0) / 100
+            target = dep["targetId"]
+            if target not in max_risk_by_target or risk > max_risk_by_target[target]:
+                max_risk_by_target[target] = risk
+                
+        n = len(work_items)
+        max_dependency_risk = np.zeros(n, dtype=np.float64)
+        has_dependencies = np.zeros(n, dtype=np.bool_)
+        for i, item in enumerate(work_items):
+            risk = max_risk_by_target.get(item["id"])
+            if risk is not None:
+                max_dependency_risk[i] = risk
+                has_dependencies[i] = True
                 
-            features.append([time_feature, people_feature, productivity])
+        return max_dependency_risk, has_dependencies
+    
+    def _dependency_depths(self, work_items: List[Dict[str, Any]],
+                           dependencies: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Compute how deep each work item sits in its dependency chain.
+        
+        Args:
+            work_items: List of work item dictionaries
+            dependencies: List of dependency dictionaries
+            
+        Returns:
+            Array with the longest downstream chain length of each work item
+        """
+        # Build dependency graph and in-degrees in one pass
+        dependency_graph = defaultdict(list)
+        in_degree = defaultdict(int)
+        for dep in dependencies:
+            dependency_graph[dep["sourceId"]].append(dep["targetId"])
+            in_degree[dep["targetId"]] += 1
+            
+        # Topological order via Kahn's algorithm
+        queue = deque(node for node in dependency_graph if in_degree[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for child in dependency_graph.get(node, ()):
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+                    
+        # Longest downstream chain for each item, walking the order in reverse.
+        # Nodes on (or downstream of) a cycle never reach in-degree 0 and keep depth 0.
+        depths = {}
+        for node in reversed(order):
+            children = dependency_graph.get(node)
+            depths[node] = 1 + max(depths.get(child, 0) for child in children) if children else 0
+            
+        return np.fromiter((depths.get(item["id"], 0) for item in work_items),
+                           dtype=np.float64, count=len(work_items))
+    
+    def extract_brooks_law_features(self, work_items: List[Dict[str, Any]], 
+                                   team_velocities: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Extract features relevant to Brooks' Law PDE.
+        
+        Args:
+            work_items: List of work item dictionaries
+            team_velocities: Team velocity data
             
-        return np.array(features)
+        Returns:
+            Array of [time, people, productivity] features
+        """
+        sprint_num, _, _, team_idx, teams = _pack_work_items(work_items)
+        team_size_by_team, productivity_by_team = self._team_features(work_items, teams, team_velocities)
+        
+        return _brooks_kernel(sprint_num, team_idx, team_size_by_team, productivity_by_team)
     
     def extract_critical_chain_features(self, work_items: List[Dict[str, Any]], 
                                        dependencies: List[Dict[str, Any]]) -> np.ndarray:
@@ -187,32 +506,10 @@ class PINNDataPreprocessor:
         Returns:
             Array of [duration, buffer, effective_duration] features
         """
-        features = []
-        
-        # Create a map for quick lookup
-        work_item_map = {item["id"]: item for item in work_items}
+        _, story_points, risk, _, _ = _pack_work_items(work_items)
+        max_dependency_risk, has_dependencies = self._max_dependency_risk(work_items, dependencies)
         
-        for item in work_items:
-            # Nominal duration (from story points)
-            story_points = item.get("storyPoints", 3)
-            nominal_duration = story_points / 13  # Normalize to [0,1] assuming max 13 points
-            
-            # Buffer (calculated from slack in schedule)
-            dependencies_for_item = [d for d in dependencies if d["targetId"] == item["id"]]
-            if dependencies_for_item:
-                # Calculate slack based on dependencies
-                max_dependency_risk = max((d.get("riskScore", 0) / 100) for d in dependencies_for_item)
-                buffer = 0.3 * (1 - max_dependency_risk)  # Higher risk = lower buffer
-            else:
-                buffer = 0.3  # Default buffer
-                
-            # Effective duration (actual time taken including delays)
-            delay_factor = item.get("riskScore", 50) / 100  # Normalize to [0,1]
-            effective_duration = nominal_duration * (1 + delay_factor)
-            
-            features.append([nominal_duration, buffer, effective_duration])
-            
-        return np.array(features)
+        return _critical_chain_kernel(story_points, risk, max_dependency_risk, has_dependencies)
     
     def extract_dependency_propagation_features(self, 
                                               work_items: List[Dict[str, Any]], 
@@ -227,63 +524,58 @@ class PINNDataPreprocessor:
         Returns:
             Array of [time, dependency_depth, delay] features
         """
-        features = []
+        sprint_num, _, risk, _, _ = _pack_work_items(work_items)
+        depth = self._dependency_depths(work_items, dependencies)
         
-        # Build dependency graph
-        dependency_graph = {}
-        for dep in dependencies:
-            if dep["sourceId"] not in dependency_graph:
-                dependency_graph[dep["sourceId"]] = []
-            dependency_graph[dep["sourceId"]].append(dep["targetId"])
-            
-        # Calculate dependency depth for each item
-        depths = {}
+        return _dependency_kernel(sprint_num, depth, risk)
+    
+    def extract_all_features(self, work_items: List[Dict[str, Any]],
+                             dependencies: List[Dict[str, Any]],
+                             team_velocities: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extract the features of all three PDEs in a single pass over the work items.
         
-        def calc_depth(item_id, visited=None):
-            if visited is None:
-                visited = set()
-                
-            if item_id in visited:
-                return 0  # Avoid cycles
-                
-            visited.add(item_id)
-                
-            if item_id not in dependency_graph:
-                return 0
-                
-            max_depth = 0
-            for dep_id in dependency_graph[item_id]:
-                depth = calc_depth(dep_id, visited.copy()) + 1
-                max_depth = max(max_depth, depth)
-                
-            return max_depth
-            
-        for item in work_items:
-            depths[item["id"]] = calc_depth(item["id"])
-            
-        # Create features
-        for item in work_items:
-            # Time feature (normalized to sprint)
-            sprint_match = re.search(r'Sprint (\d+)', item.get("sprint", "Sprint 0"))
-            sprint_num = int(sprint_match.group(1)) if sprint_match else 0
-            time_feature = sprint_num / 20  # Normalize to [0,1] assuming max 20 sprints
-            
-            # Dependency depth (how deep in the dependency chain)
-            depth = depths[item["id"]] / 10  # Normalize to [0,1] assuming max depth of 10
-            
-            # Delay (from risk score)
-            delay = item.get("riskScore", 50) / 100  # Normalize to [0,1]
+        Args:
+            work_items: List of work item dictionaries
+            dependencies: List of dependency dictionaries
+            team_velocities: Team velocity data
             
-            features.append([time_feature, depth, delay])
+        Returns:
+            Tuple of (brooks, critical_chain, dependency) feature arrays, each
+            matching the output of the corresponding extract_* method
+        """
+        features = self._extract_feature_matrix(work_items, dependencies, team_velocities)
+        return features[:, 0:3], features[:, 3:6], features[:, 6:9]
+    
+    def _extract_feature_matrix(self, work_items: List[Dict[str, Any]],
+                                dependencies: List[Dict[str, Any]],
+                                team_velocities: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Extract the features of all three PDEs into a single (N, 9) array.
+        
+        Args:
+            work_items: List of work item dictionaries
+            dependencies: List of dependency dictionaries
+            team_velocities: Team velocity data
             
-        return np.array(features)
+        Returns:
+            Array whose column blocks 0:3, 3:6 and 6:9 hold the Brooks' Law,
+            Critical Chain and Dependency Propagation features
+        """
+        sprint_num, story_points, risk, team_idx, teams = _pack_work_items(work_items)
+        team_size_by_team, productivity_by_team = self._team_features(work_items, teams, team_velocities)
+        max_dependency_risk, has_dependencies = self._max_dependency_risk(work_items, dependencies)
+        depth = self._dependency_depths(work_items, dependencies)
+        
+        return _all_features_kernel(sprint_num, story_points, risk, team_idx, team_size_by_team,
+                                    productivity_by_team, max_dependency_risk, has_dependencies, depth)
     
     def normalize_features(self, features: np.ndarray, feature_name: str) -> np.ndarray:
         """
-        Normalize features to [0,1] range and store normalization parameters.
+        Normalize features to [0,1] range in place and store normalization parameters.
         
         Args:
-            features: Feature array to normalize
+            features: Feature array to normalize (overwritten with the result)
             feature_name: Name to identify this feature set
             
         Returns:
@@ -297,16 +589,21 @@ class PINNDataPreprocessor:
         ranges = feature_maxs - feature_mins
         ranges[ranges == 0] = 1
         
-        # Store for later use
+        # Precompute the reciprocal so normalizing multiplies instead of divides
+        inv_ranges = np.reciprocal(ranges, dtype=np.float32)
+        
+        # Store for later use; the patched ranges only serve the forward path
         self.feature_ranges[feature_name] = {
             "mins": feature_mins,
-            "maxs": feature_maxs
+            "maxs": feature_maxs,
+            "inv_ranges": inv_ranges
         }
         
         # Normalize
-        normalized_features = (features - feature_mins) / ranges
+        np.subtract(features, feature_mins, out=features)
+        np.multiply(features, inv_ranges, out=features)
         
-        return normalized_features
+        return features
     
     def denormalize_features(self, normalized_features: np.ndarray, feature_name: str) -> np.ndarray:
         """
@@ -324,19 +621,22 @@ class PINNDataPreprocessor:
             
         feature_mins = self.feature_ranges[feature_name]["mins"]
         feature_maxs = self.feature_ranges[feature_name]["maxs"]
+        
+        # Use the true ranges, so constant columns map back to exactly their min
         ranges = feature_maxs - feature_mins
         
         # Denormalize
-        denormalized_features = normalized_features * ranges + feature_mins
+        denormalized_features = np.multiply(normalized_features, ranges)
+        np.add(denormalized_features, feature_mins, out=denormalized_features)
         
         return denormalized_features
     
-    def prepare_training_data(self, 
-                            work_items: List[Dict[str, Any]], 
-                            dependencies: List[Dict[str, Any]],
-                            team_velocities: List[Dict[str, Any]]) -> Dict[str, torch.Tensor]:
+    def prepare_training_data_np(self, 
+                               work_items: List[Dict[str, Any]], 
+                               dependencies: List[Dict[str, Any]],
+                               team_velocities: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
         """
-        Prepare complete training dataset for PINN model.
+        Prepare complete training dataset for PINN model as NumPy arrays.
         
         Args:
             work_items: List of work item dictionaries
@@ -344,82 +644,90 @@ class PINNDataPreprocessor:
             team_velocities: Team velocity data
             
         Returns:
-            Dictionary of PyTorch tensors for training
+            Dictionary of float32 arrays for training
         """
         # Apply GDPR compliance processing
         processed_work_items, processed_dependencies = \
             self.gdpr_processor.process_dataset(work_items, dependencies)
         
-        # Extract features for each PDE
-        brooks_features = self.extract_brooks_law_features(processed_work_items, team_velocities)
-        critical_chain_features = self.extract_critical_chain_features(processed_work_items, processed_dependencies)
-        dependency_features = self.extract_dependency_propagation_features(processed_work_items, processed_dependencies)
-        
-        # Normalize features
-        brooks_features_norm = self.normalize_features(brooks_features, "brooks")
-        critical_chain_features_norm = self.normalize_features(critical_chain_features, "critical_chain")
-        dependency_features_norm = self.normalize_features(dependency_features, "dependency")
+        # Extract features for each PDE in one pass into a single buffer
+        features = self._extract_feature_matrix(processed_work_items, processed_dependencies, team_velocities)
         
-        # Combine features for training
-        X_brooks = brooks_features_norm[:, :2]  # time, people
-        Y_brooks = brooks_features_norm[:, 2:3]  # productivity
+        # Normalize each PDE's column block in place
+        self.normalize_features(features[:, 0:3], "brooks")
+        self.normalize_features(features[:, 3:6], "critical_chain")
+        self.normalize_features(features[:, 6:9], "dependency")
         
-        X_critical = critical_chain_features_norm[:, :2]  # duration, buffer
-        Y_critical = critical_chain_features_norm[:, 2:3]  # effective_duration
+        # Gather inputs (time, people | duration, buffer | time, depth) and
+        # outputs (productivity | effective_duration | delay) for the unified model;
+        # np.take keeps the gathered arrays C-contiguous, unlike fancy indexing
+        X_combined = np.take(features, X_COLS, axis=1)
+        Y_combined = np.take(features, Y_COLS, axis=1)
         
-        X_dependency = dependency_features_norm[:, :2]  # time, depth
-        Y_dependency = dependency_features_norm[:, 2:3]  # delay
-        
-        # Combined inputs and outputs for unified model
-        X_combined = np.concatenate([
-            X_brooks, X_critical, X_dependency
-        ], axis=1)
+        # The per-PDE arrays are column views of the combined arrays
+        return {
+            "X": X_combined,
+            "Y": Y_combined,
+            "X_brooks": X_combined[:, 0:2],
+            "Y_brooks": Y_combined[:, 0:1],
+            "X_critical": X_combined[:, 2:4],
+            "Y_critical": Y_combined[:, 1:2],
+            "X_dependency": X_combined[:, 4:6],
+            "Y_dependency": Y_combined[:, 2:3]
+        }
+    
+    def prepare_training_data(self, 
+                            work_items: List[Dict[str, Any]], 
+                            dependencies: List[Dict[str, Any]],
+                            team_velocities: List[Dict[str, Any]]) -> Dict[str, "torch.Tensor"]:
+        """
+        Prepare complete training dataset for PINN model.
         
-        Y_combined = np.concatenate([
-            Y_brooks, Y_critical, Y_dependency
-        ], axis=1)
+        Args:
+            work_items: List of work item dictionaries
+            dependencies: List of dependency dictionaries
+            team_velocities: Team velocity data
+            
+        Returns:
+            Dictionary of PyTorch tensors for training
+        """
+        # Imported here so NumPy-only callers never pay for loading torch
+        import torch
         
-        # Create PyTorch tensors
-        X_tensor = torch.tensor(X_combined, dtype=torch.float32)
-        Y_tensor = torch.tensor(Y_combined, dtype=torch.float32)
+        arrays = self.prepare_training_data_np(work_items, dependencies, team_velocities)
         
-        return {
-            "X": X_tensor,
-            "Y": Y_tensor,
-            "X_brooks": torch.tensor(X_brooks, dtype=torch.float32),
-            "Y_brooks": torch.tensor(Y_brooks, dtype=torch.float32),
-            "X_critical": torch.tensor(X_critical, dtype=torch.float32),
-            "Y_critical": torch.tensor(Y_critical, dtype=torch.float32),
-            "X_dependency": torch.tensor(X_dependency, dtype=torch.float32),
-            "Y_dependency": torch.tensor(Y_dependency, dtype=torch.float32)
-        }
+        # Tensors share memory with the arrays
+        return {name: torch.from_numpy(array) for name, array in arrays.items()}
 
 
 # Utility functions
 
-def preprocess_ado_data(work_items_json, dependencies_json, team_velocities_json):
+def preprocess_ado_data(work_items_json, dependencies_json, team_velocities_json, return_tensors: bool = True):
     """
     Preprocess ADO data from JSON format for PINN training.
     
     Args:
-        work_items_json: JSON string with work items data
-        dependencies_json: JSON string with dependencies data
-        team_velocities_json: JSON string with team velocities data
+        work_items_json: JSON string or UTF-8 bytes with work items data
+        dependencies_json: JSON string or UTF-8 bytes with dependencies data
+        team_velocities_json: JSON string or UTF-8 bytes with team velocities data
+        return_tensors: Return PyTorch tensors if True, NumPy arrays otherwise
         
     Returns:
         Preprocessed data dictionary for PINN training
     """
     try:
         # Parse JSON data
-        work_items = json.loads(work_items_json)
-        dependencies = json.loads(dependencies_json)
-        team_velocities = json.loads(team_velocities_json)
+        work_items = _json_loads(work_items_json)
+        dependencies = _json_loads(dependencies_json)
+        team_velocities = _json_loads(team_velocities_json)
         
         # Create preprocessor and prepare data
         gdpr_processor = GDPRCompliantProcessor()
         preprocessor = PINNDataPreprocessor(gdpr_processor)
         
-        return preprocessor.prepare_training_data(work_items, dependencies, team_velocities)
+        if return_tensors:
+            return preprocessor.prepare_training_data(work_items, dependencies, team_velocities)
+        return preprocessor.prepare_training_data_np(work_items, dependencies, team_velocities)
         
     except Exception as e:
         print(f"Error preprocessing ADO data: {str(e)}")
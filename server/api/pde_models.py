@@ -1,8 +1,20 @@
 #!/usr/bin/env python3
+import functools
+import os
 import numpy as np
 import deepxde as dde
 import torch
 
+# Numba is optional; without it the condition kernels run as plain NumPy expressions
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 """
 This module defines the partial differential equations (PDEs) that model software development
 physics based on established project management theories like Brooks' Law and Critical Chain Theory.
@@ -11,6 +23,268 @@ These PDEs will be incorporated into Physics-Informed Neural Networks (PINNs) to
 dependencies, risks, and delays in software development projects.
 """
 
+
+# Backward seeds keyed by (basis, shape, dtype, device). Batch shapes are fixed
+# during training, so this holds a handful of entries reused every step.
+_GRAD_SEED_CACHE = {}
+
+
+def _grad_seed(y, basis):
+    """
+    Return a cached grad_outputs seed for differentiating y.
+    
+    Args:
+        y: Network output of shape (N, m)
+        basis: If True, return one basis vector per output column with shape
+               (m, N, m) for a batched backward; otherwise a ones tensor like y
+               
+    Returns:
+        Constant seed tensor (never modified in place, so safe to share)
+    """
+    key = (basis, y.shape, y.dtype, y.device)
+    seed = _GRAD_SEED_CACHE.get(key)
+    if seed is None:
+        if basis:
+            n, m = y.shape
+            seed = torch.eye(m, dtype=y.dtype, device=y.device).unsqueeze(1).expand(m, n, m)
+        else:
+            seed = torch.ones_like(y)
+        _GRAD_SEED_CACHE[key] = seed
+    return seed
+
+
+def _input_gradients(y, x):
+    """
+    Differentiate a single-column network output with respect to every input column.
+    
+    Rows of x are independent samples, so one backward pass of y against a
+    ones vector yields dy/dx for all samples and all input columns at once.
+    
+    Args:
+        y: Network output of shape (N, 1)
+        x: Input coordinates of shape (N, k) that y was computed from
+        
+    Returns:
+        Gradient tensor of shape (N, k), kept differentiable for the PDE loss
+    """
+    return torch.autograd.grad(y, x, grad_outputs=_grad_seed(y, basis=False), create_graph=True)[0]
+
+
+def _output_gradients(y, x):
+    """
+    Differentiate every network output column with respect to every input column.
+    
+    The per-output backward passes are batched into a single autograd call by
+    seeding it with one basis vector per output column.
+    
+    Args:
+        y: Network output of shape (N, m)
+        x: Input coordinates of shape (N, k) that y was computed from
+        
+    Returns:
+        Gradient tensor of shape (m, N, k) where [j] holds dy[:, j]/dx
+    """
+    return torch.autograd.grad(y, x, grad_outputs=_grad_seed(y, basis=True), create_graph=True,
+                               is_grads_batched=True)[0]
+
+
+def _model_output_gradients(forward, x):
+    """
+    Per-sample Jacobians of a model's outputs with respect to its inputs.
+    
+    Each row is an independent sample, so jacrev over a single row vectorized
+    with vmap yields every Jacobian in one batched pass, without needing x to
+    track gradients.
+    
+    Args:
+        forward: Function mapping (N, k) inputs to (N, m) outputs
+        x: Input coordinates of shape (N, k)
+        
+    Returns:
+        Gradient tensor of shape (m, N, k), laid out like _output_gradients
+    """
+    def single_sample(x_row):
+        return forward(x_row.unsqueeze(0)).squeeze(0)
+        
+    return torch.func.vmap(torch.func.jacrev(single_sample))(x).permute(1, 0, 2)
+
+
+def _on_boundary_at(index, value):
+    """
+    Build a boundary predicate selecting points whose coordinate equals a bound.
+    
+    DeepXDE calls the predicate once per point, so the np.isclose tolerance is
+    precomputed and compared with plain float arithmetic.
+    
+    Args:
+        index: Coordinate index to test
+        value: Bound the coordinate must match
+        
+    Returns:
+        Predicate taking (x, on_boundary) for a single point x
+    """
+    value = float(value)
+    tolerance = 1e-8 + 1e-5 * abs(value)  # np.isclose defaults
+    return lambda x, on_boundary: on_boundary and abs(x[index] - value) <= tolerance
+
+
+# Residual kernels
+#
+# The pure tensor arithmetic of each PDE. Setting PINN_COMPILE_RESIDUALS=1
+# compiles them with torch.compile so each residual runs as one fused kernel.
+# The persistent worker pays the seconds of compilation only once, but it is
+# still opt-in: the compiled backward does not support retain_graph/create_graph,
+# and inductor needs a working C++ toolchain on the host.
+
+COMPILE_RESIDUALS = os.environ.get("PINN_COMPILE_RESIDUALS", "0") == "1"
+
+
+def _fused(fn):
+    """Compile a residual kernel with torch.compile when COMPILE_RESIDUALS is set."""
+    if COMPILE_RESIDUALS:
+        return torch.compile(fn, dynamic=True)
+    return fn
+
+
+@_fused
+def _brooks_residual(P, P_t, P_p, p, comm_factor: float):
+    """dP/dt + C * p^2 * dP/dp - p * (1 - P)"""
+    # p * p avoids the generic pow path; p * (1 - P) is expanded to skip a temporary
+    return P_t + comm_factor * (p * p) * P_p - p + p * P
+
+
+@_fused
+def _critical_chain_residual(E_d, E_b, b, inv_buffer_limit: float, alpha: float):
+    """dE/dd + dE/db - alpha * (1 - clamp(b / b_limit, 0, 1))"""
+    buffer_ratio = (b * inv_buffer_limit).clamp_(0.0, 1.0)
+    return E_d + E_b - alpha * (1 - buffer_ratio)
+
+
+@_fused
+def _dependency_residual(D, D_t, D_d, v: float, gamma: float):
+    """dD/dt + v * dD/dd + gamma * D"""
+    return D_t + v * D_d + gamma * D
+
+
+@_fused
+def _multi_residual(x, y, dy_dx, comm_factor: float, inv_buffer_limit: float, alpha: float,
+                    v: float, gamma: float):
+    """Brooks, Critical Chain and Dependency residuals of the combined model as (N, 3) columns."""
+    _, p, _, b, _, _ = x.split(1, dim=1)
+    P, _, D = y.split(1, dim=1)
+    return torch.cat([
+        _brooks_residual(P, dy_dx[0, :, 0:1], dy_dx[0, :, 1:2], p, comm_factor),
+        _critical_chain_residual(dy_dx[1, :, 2:3], dy_dx[1, :, 3:4], b, inv_buffer_limit, alpha),
+        _dependency_residual(D, dy_dx[2, :, 4:5], dy_dx[2, :, 5:6], v, gamma)
+    ], dim=1)
+
+
+# Geometry factories
+#
+# DeepXDE geometries are immutable for fixed bounds, so PDE instances with
+# equal bounds (e.g. across hyperparameter sweeps) share one object.
+
+@functools.lru_cache(maxsize=None)
+def _rectangle(bounds):
+    """Rectangle spanning (x0_min, x0_max, x1_min, x1_max) bounds."""
+    x0_min, x0_max, x1_min, x1_max = bounds
+    return dde.geometry.Rectangle([x0_min, x1_min], [x0_max, x1_max])
+
+
+@functools.lru_cache(maxsize=None)
+def _rectangle_x_time(bounds):
+    """Rectangle with a time domain over its first coordinate's range."""
+    t_min, t_max, _, _ = bounds
+    return dde.geometry.GeometryXTime(_rectangle(bounds), dde.geometry.TimeDomain(t_min, t_max))
+
+
+# Initial/boundary condition kernels
+#
+# DeepXDE evaluates these on NumPy arrays of sampled points whenever it
+# resamples or computes the condition losses, so they are compiled once.
+# Numba computes with float64 literals, hence the cast back to the input dtype.
+
+@njit(cache=True, fastmath=True)
+def _brooks_initial_condition(x):
+    """Initial productivity p / (1 + 0.1 p) for points (t, p)."""
+    p = x[:, 1:2]
+    return (p / (1.0 + 0.1 * p)).astype(x.dtype)
+
+
+@njit(cache=True, fastmath=True)
+def _dependency_initial_condition(x):
+    """Initial delay exp(-d), decaying with dependency depth, for points (t, d)."""
+    return np.exp(-x[:, 1:2]).astype(x.dtype)
+
+
+@njit(cache=True, fastmath=True)
+def _dependency_source_condition(x):
+    """Delay exp(-0.5 t) at the source of the dependency chain for points (t, d)."""
+    return np.exp(-0.5 * x[:, 0:1]).astype(x.dtype)
+
+
+# NumPy reference residuals
+#
+# The same equations as the torch kernels above, evaluated on NumPy arrays of
+# precomputed derivatives (e.g. finite differences) without building autograd
+# graphs. Useful for generating warm-start data and checking trained models.
+# Results keep the dtype of the derivative arrays.
+
+@njit(cache=True, parallel=True, fastmath=True)
+def brooks_residual_np(p, P, P_t, P_p, comm_factor=0.1):
+    """
+    Brooks' Law residual dP/dt + C * p^2 * dP/dp - p * (1 - P).
+    
+    Args:
+        p: People
+        P: Productivity
+        P_t: dP/dt
+        P_p: dP/dp
+        comm_factor: Communication overhead factor C
+        
+    Returns:
+        Residual array with the broadcast shape of the inputs
+    """
+    return (P_t + comm_factor * p * p * P_p - p * (1.0 - P)).astype(P_t.dtype)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def critical_chain_residual_np(b, E_d, E_b, buffer_limit=0.3, alpha=0.5):
+    """
+    Critical Chain residual dE/dd + dE/db - alpha * (1 - clamp(b / b_limit, 0, 1)).
+    
+    Args:
+        b: Buffer size
+        E_d: dE/dd
+        E_b: dE/db
+        buffer_limit: Maximum effective buffer ratio
+        alpha: Scaling factor of the buffer term
+        
+    Returns:
+        Residual array with the broadcast shape of the inputs
+    """
+    buffer_ratio = np.minimum(np.maximum(b * (1.0 / buffer_limit), 0.0), 1.0)
+    return (E_d + E_b - alpha * (1.0 - buffer_ratio)).astype(E_d.dtype)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def dependency_residual_np(D, D_t, D_d, propagation_factor=0.8, gamma=0.2):
+    """
+    Dependency Propagation residual dD/dt + v * dD/dd + gamma * D.
+    
+    Args:
+        D: Delay
+        D_t: dD/dt
+        D_d: dD/dd
+        propagation_factor: Propagation velocity v
+        gamma: Decay factor
+        
+    Returns:
+        Residual array with the broadcast shape of the inputs
+    """
+    return (D_t + propagation_factor * D_d + gamma * D).astype(D_t.dtype)
+
+
 class BrooksLawPDE:
     """
     Brooks' Law states: "Adding manpower to a late software project makes it later."
@@ -28,15 +302,14 @@ class BrooksLawPDE:
             comm_factor: Communication overhead factor (default: 0.1)
         """
         self.domain_bounds = domain_bounds
-        self.comm_factor = comm_factor
+        self.comm_factor = float(comm_factor)
         self.create_domain()
         
     def create_domain(self):
         """Create the computational domain for the PDE."""
-        t_min, t_max, p_min, p_max = self.domain_bounds
-        self.geom = dde.geometry.Rectangle([t_min, p_min], [t_max, p_max])
-        self.timedomain = dde.geometry.TimeDomain(t_min, t_max)
-        self.geomtime = dde.geometry.GeometryXTime(self.geom, self.timedomain)
+        self.geomtime = _rectangle_x_time(tuple(self.domain_bounds))
+        self.geom = self.geomtime.geometry
+        self.timedomain = self.geomtime.timedomain
         
     def pde(self, x, y):
         """
@@ -54,22 +327,33 @@ class BrooksLawPDE:
             x: Input coordinates (t, p)
             y: Network output (P - productivity)
             
+        Returns:
+            The residual of the PDE
+        """
+        return self.residual_from_grads(x, y, _input_gradients(y, x))
+    
+    def residual_from_grads(self, x, y, grads):
+        """
+        Brooks' Law residual from precomputed input gradients.
+        
+        Args:
+            x: Input coordinates (t, p)
+            y: Network output (P - productivity)
+            grads: Gradients of y with respect to (t, p), shape (N, 2)
+            
         Returns:
             The residual of the PDE
         """
         # Extract variables
         P = y
-        
-        # Get gradients
-        P_t = dde.grad.jacobian(y, x, i=0, j=0)
-        P_p = dde.grad.jacobian(y, x, i=0, j=1)
+        P_t, P_p = grads.split(1, dim=1)
         
         # Extract time and people variables
-        t, p = x[:, 0:1], x[:, 1:2]
+        t, p = x.split(1, dim=1)
         
         # Brooks' Law PDE
         # dP/dt + C * p^2 * dP/dp = p * (1 - P)
-        return P_t + self.comm_factor * p**2 * P_p - p * (1 - P)
+        return _brooks_residual(P, P_t, P_p, p, self.comm_factor)
     
     def set_boundary_conditions(self, func=None):
         """
@@ -84,14 +368,13 @@ class BrooksLawPDE:
         # Default initial conditions: At t=0, productivity is proportional to people
         if func is None:
             def initial_condition(x):
-                t, p = x[:, 0:1], x[:, 1:2]
-                return p / (1 + 0.1 * p)  # Initial productivity formula
+                return _brooks_initial_condition(x)  # Initial productivity formula
         else:
             initial_condition = func
             
         # Set t=0 as initial condition
         t_min, _, _, _ = self.domain_bounds
-        ic = dde.icbc.IC(self.geomtime, initial_condition, lambda _, on_boundary: on_boundary and np.isclose(_, t_min))
+        ic = dde.icbc.IC(self.geomtime, initial_condition, _on_boundary_at(0, t_min))
         
         return [ic]
 
@@ -103,7 +386,7 @@ class CriticalChainPDE:
     This is modeled as a PDE where task duration is influenced by buffers, resources,
     and dependencies between tasks.
     """
-    def __init__(self, domain_bounds, buffer_limit=0.3):
+    def __init__(self, domain_bounds, buffer_limit=0.3, alpha=0.5):
         """
         Initialize the Critical Chain PDE model.
         
@@ -111,15 +394,17 @@ class CriticalChainPDE:
             domain_bounds: Tuple of (d_min, d_max, b_min, b_max) defining the domain
                           d represents task duration and b represents buffer size
             buffer_limit: Maximum effective buffer ratio (default: 0.3)
+            alpha: Scaling factor of the buffer term (default: 0.5)
         """
         self.domain_bounds = domain_bounds
         self.buffer_limit = buffer_limit
+        self.alpha = float(alpha)
+        self._inv_buffer_limit = 1.0 / float(buffer_limit)
         self.create_domain()
         
     def create_domain(self):
         """Create the computational domain for the PDE."""
-        d_min, d_max, b_min, b_max = self.domain_bounds
-        self.geom = dde.geometry.Rectangle([d_min, b_min], [d_max, b_max])
+        self.geom = _rectangle(tuple(self.domain_bounds))
         
     def pde(self, x, y):
         """
@@ -139,25 +424,36 @@ class CriticalChainPDE:
             x: Input coordinates (d, b)
             y: Network output (E - effective duration)
             
+        Returns:
+            The residual of the PDE
+        """
+        return self.residual_from_grads(x, y, _input_gradients(y, x))
+    
+    def residual_from_grads(self, x, y, grads):
+        """
+        Critical Chain residual from precomputed input gradients.
+        
+        Args:
+            x: Input coordinates (d, b)
+            y: Network output (E - effective duration)
+            grads: Gradients of y with respect to (d, b), shape (N, 2)
+            
         Returns:
             The residual of the PDE
         """
         # Extract variables
         E = y
-        
-        # Get gradients
-        E_d = dde.grad.jacobian(y, x, i=0, j=0)
-        E_b = dde.grad.jacobian(y, x, i=0, j=1)
+        E_d, E_b = grads.split(1, dim=1)
         
         # Extract duration and buffer variables
-        d, b = x[:, 0:1], x[:, 1:2]
+        d, b = x.split(1, dim=1)
         
         # Alpha is a scaling factor (varies with domain)
-        alpha = 0.5
+        alpha = self.alpha
         
         # Critical Chain PDE
         # dE/dd + dE/db = alpha * (1 - b/b_limit)
-        return E_d + E_b - alpha * (1 - torch.clamp(b / self.buffer_limit, 0, 1))
+        return _critical_chain_residual(E_d, E_b, b, self._inv_buffer_limit, alpha)
     
     def set_boundary_conditions(self):
         """
@@ -174,7 +470,7 @@ class CriticalChainPDE:
             return d  # Effective duration equals nominal duration
         
         # Set boundary condition
-        bc = dde.icbc.DirichletBC(self.geom, bc_func, lambda x, on_boundary: on_boundary and np.isclose(x[1], b_min))
+        bc = dde.icbc.DirichletBC(self.geom, bc_func, _on_boundary_at(1, b_min))
         
         return [bc]
 
@@ -183,7 +479,7 @@ class DependencyPropagationPDE:
     """
     This PDE models how delays propagate through dependent tasks in a project.
     """
-    def __init__(self, domain_bounds, propagation_factor=0.8):
+    def __init__(self, domain_bounds, propagation_factor=0.8, gamma=0.2):
         """
         Initialize the Dependency Propagation PDE model.
         
@@ -191,15 +487,16 @@ class DependencyPropagationPDE:
             domain_bounds: Tuple of (t_min, t_max, d_min, d_max) defining the domain
                           t represents time and d represents dependency depth
             propagation_factor: How much of a delay propagates to dependencies (default: 0.8)
+            gamma: Decay factor of delays over time (default: 0.2)
         """
         self.domain_bounds = domain_bounds
-        self.propagation_factor = propagation_factor
+        self.propagation_factor = float(propagation_factor)
+        self.gamma = float(gamma)
         self.create_domain()
         
     def create_domain(self):
         """Create the computational domain for the PDE."""
-        t_min, t_max, d_min, d_max = self.domain_bounds
-        self.geom = dde.geometry.Rectangle([t_min, d_min], [t_max, d_max])
+        self.geom = _rectangle(tuple(self.domain_bounds))
         
     def pde(self, x, y):
         """
@@ -219,28 +516,39 @@ class DependencyPropagationPDE:
             x: Input coordinates (t, d)
             y: Network output (D - delay)
             
+        Returns:
+            The residual of the PDE
+        """
+        return self.residual_from_grads(x, y, _input_gradients(y, x))
+    
+    def residual_from_grads(self, x, y, grads):
+        """
+        Dependency Propagation residual from precomputed input gradients.
+        
+        Args:
+            x: Input coordinates (t, d)
+            y: Network output (D - delay)
+            grads: Gradients of y with respect to (t, d), shape (N, 2)
+            
         Returns:
             The residual of the PDE
         """
         # Extract variables
         D = y
-        
-        # Get gradients
-        D_t = dde.grad.jacobian(y, x, i=0, j=0)
-        D_d = dde.grad.jacobian(y, x, i=0, j=1)
+        D_t, D_d = grads.split(1, dim=1)
         
         # Extract time and dependency depth variables
-        t, d = x[:, 0:1], x[:, 1:2]
+        t, d = x.split(1, dim=1)
         
         # Propagation velocity (depends on project complexity)
         v = self.propagation_factor
         
         # Decay factor (delays naturally diminish over time)
-        gamma = 0.2
+        gamma = self.gamma
         
         # Dependency Propagation PDE
         # dD/dt + v * dD/dd = -gamma * D
-        return D_t + v * D_d + gamma * D
+        return _dependency_residual(D, D_t, D_d, v, gamma)
     
     def set_boundary_conditions(self, initial_delay_func=None):
         """
@@ -257,24 +565,90 @@ class DependencyPropagationPDE:
         # Default initial condition: At t=0, delay at d=0 is highest and decays with depth
         if initial_delay_func is None:
             def initial_condition(x):
-                t, d = x[:, 0:1], x[:, 1:2]
-                return np.exp(-d)  # Exponential decay of initial delay with depth
+                return _dependency_initial_condition(x)  # Exponential decay of initial delay with depth
         else:
             initial_condition = initial_delay_func
             
         # Set initial conditions at t=0
-        ic = dde.icbc.IC(self.geom, initial_condition, lambda x, on_boundary: on_boundary and np.isclose(x[0], t_min))
+        ic = dde.icbc.IC(self.geom, initial_condition, _on_boundary_at(0, t_min))
         
         # Set boundary condition at d=0 (source of delay)
         def bc_func(x):
-            t = x[:, 0:1]
-            return np.exp(-0.5 * t)  # Delay at source decays with time
+            return _dependency_source_condition(x)  # Delay at source decays with time
             
-        bc = dde.icbc.DirichletBC(self.geom, bc_func, lambda x, on_boundary: on_boundary and np.isclose(x[1], d_min))
+        bc = dde.icbc.DirichletBC(self.geom, bc_func, _on_boundary_at(1, d_min))
         
         return [ic, bc]
 
 
+class MultiPDE:
+    """
+    All three project physics PDEs evaluated together on the combined model.
+    
+    The combined model maps (t, p, d, b, t, depth) inputs to (P, E, D) outputs;
+    the three residuals are computed in one pass as the columns of an (N, 3)
+    tensor and reduced with a single weighted matrix-vector product.
+    """
+    def __init__(self, brooks_pde, critical_chain_pde, dependency_pde, weights=(0.4, 0.4, 0.2)):
+        """
+        Initialize the combined PDE from its component models.
+        
+        Args:
+            brooks_pde: BrooksLawPDE supplying the communication factor
+            critical_chain_pde: CriticalChainPDE supplying the buffer limit and alpha
+            dependency_pde: DependencyPropagationPDE supplying the propagation and decay factors
+            weights: Weights of the (brooks, critical_chain, dependency) residuals
+        """
+        self.comm_factor = brooks_pde.comm_factor
+        self.inv_buffer_limit = critical_chain_pde._inv_buffer_limit
+        self.alpha = critical_chain_pde.alpha
+        self.propagation_factor = dependency_pde.propagation_factor
+        self.gamma = dependency_pde.gamma
+        self.weights = tuple(float(w) for w in weights)
+        self._weight_columns = {}
+        
+    def residuals(self, x, y, dy_dx=None):
+        """
+        Unweighted residuals of all three PDEs.
+        
+        Args:
+            x: Input coordinates of shape (N, 6)
+            y: Network output of shape (N, 3)
+            dy_dx: Optional precomputed output gradients of shape (3, N, 6)
+            
+        Returns:
+            Residual tensor of shape (N, 3) with one column per PDE
+        """
+        if dy_dx is None:
+            dy_dx = _output_gradients(y, x)
+            
+        return _multi_residual(x, y, dy_dx, self.comm_factor, self.inv_buffer_limit,
+                               self.alpha, self.propagation_factor, self.gamma)
+    
+    def pde(self, x, y, dy_dx=None):
+        """
+        Weighted sum of the three PDE residuals.
+        
+        Args:
+            x: Input coordinates of shape (N, 6)
+            y: Network output of shape (N, 3)
+            dy_dx: Optional precomputed output gradients of shape (3, N, 6)
+            
+        Returns:
+            Weighted residual of shape (N, 1)
+        """
+        residuals = self.residuals(x, y, dy_dx)
+        
+        # The (3, 1) weight column is created once per dtype/device
+        key = (residuals.dtype, residuals.device)
+        weight_column = self._weight_columns.get(key)
+        if weight_column is None:
+            weight_column = torch.tensor(self.weights, dtype=residuals.dtype, device=residuals.device).unsqueeze(1)
+            self._weight_columns[key] = weight_column
+            
+        return residuals @ weight_column
+
+
 # Utility functions for creating combined PDEs
 
 def create_combined_pde_system(domain_bounds, weights=None):
@@ -301,53 +675,63 @@ def create_combined_pde_system(domain_bounds, weights=None):
     critical_chain_pde = CriticalChainPDE(domain_bounds["critical_chain"])
     dependency_pde = DependencyPropagationPDE(domain_bounds["dependency"])
     
+    # Evaluate all three PDEs together on the combined model
+    multi_pde = MultiPDE(
+        brooks_pde, critical_chain_pde, dependency_pde,
+        weights=(weights["brooks"], weights["critical_chain"], weights["dependency"])
+    )
+    
     # Combined PDE function
-    def combined_pde(x, y):
+    def combined_pde(x, y, dy_dx=None):
         """
         Combined PDE incorporating all project physics models.
         
         Args:
             x: Input coordinates
             y: Network output
+            dy_dx: Optional precomputed output gradients of shape (3, N, 6),
+                   as returned by _output_gradients(y, x)
             
         Returns:
             Weighted sum of PDE residuals
         """
-        # Split the input coordinates for each model
-        x_brooks = x[:, :2]  # time, people
-        x_critical = x[:, 2:4]  # duration, buffer
-        x_dependency = x[:, 4:6]  # time, depth
-        
-        # Split the output for each model
-        y_brooks = y[:, 0:1]  # productivity
-        y_critical = y[:, 1:2]  # effective duration
-        y_dependency = y[:, 2:3]  # delay
-        
-        # Calculate residuals for each PDE
-        r_brooks = brooks_pde.pde(x_brooks, y_brooks)
-        r_critical = critical_chain_pde.pde(x_critical, y_critical)
-        r_dependency = dependency_pde.pde(x_dependency, y_dependency)
-        
-        # Combine residuals with weights
-        return (weights["brooks"] * r_brooks + 
-                weights["critical_chain"] * r_critical + 
-                weights["dependency"] * r_dependency)
+        return multi_pde.pde(x, y, dy_dx)
     
     return combined_pde
 
-def create_loss_function(pde_func, bias_weight=0.2, buffer_weight=0.2):
+def create_loss_function(pde_func, bias_weight=0.2, buffer_weight=0.2, buffer_limit=0.3, use_vmap=False,
+                         mixed_precision=False):
     """
     Create a composite loss function incorporating PDE residuals, bias minimization,
     and buffer overflow penalties.
     
     Args:
-        pde_func: The PDE function to compute residuals
+        pde_func: The PDE function to compute residuals, called as
+                  pde_func(x, y, dy_dx) like the one from create_combined_pde_system
         bias_weight: Weight for the bias loss term
         buffer_weight: Weight for the buffer overflow loss term
+        buffer_limit: Buffer usage above which overflow is penalized (default: 0.3)
+        use_vmap: Take the residual gradients as per-sample Jacobians with
+                  torch.func.vmap/jacrev instead of a batched backward pass
+        mixed_precision: Run the network forward and gradient passes under
+                         BF16 autocast (no gradient scaling needed for BF16)
         
     Returns:
         Loss function for training the PINN
     """
+    buffer_limit = float(buffer_limit)
+    
+    # Parameters and buffers of the last model seen. Optimizers update them in
+    # place, so the snapshot stays current across training steps.
+    model_state = {"model": None, "tensors": None}
+    
+    def model_tensors(model):
+        """Return the cached name -> tensor mapping of a model's parameters and buffers."""
+        if model_state["model"] is not model:
+            model_state["model"] = model
+            model_state["tensors"] = {**dict(model.named_parameters()), **dict(model.named_buffers())}
+        return model_state["tensors"]
+    
     def composite_loss(model, x, y_true):
         """
         Composite loss function.
@@ -360,27 +744,48 @@ def create_loss_function(pde_func, bias_weight=0.2, buffer_weight=0.2):
         Returns:
             Total loss combining data, physics, bias, and buffer terms
         """
-        # Predict outputs
-        y_pred = model(x)
+        # PDE residuals differentiate the outputs with respect to the inputs
+        if not use_vmap and not x.requires_grad:
+            x = x.detach().requires_grad_(True)
+            
+        # Call the model as a pure function of its snapshotted tensors so the
+        # same forward composes with torch.func transforms
+        tensors = model_tensors(model)
+        
+        def forward(inputs):
+            return torch.func.functional_call(model, tensors, (inputs,))
+            
+        # The network passes may run in BF16; residuals and reductions stay in FP32
+        with torch.autocast(device_type=x.device.type, dtype=torch.bfloat16, enabled=mixed_precision):
+            # Predict outputs
+            y_pred = forward(x)
+            if use_vmap:
+                # The Jacobians come from functorch, so x needs no grad tracking
+                dy_dx = _model_output_gradients(forward, x)
+            else:
+                dy_dx = _output_gradients(y_pred, x)
+                
+        if mixed_precision:
+            y_pred, dy_dx = y_pred.float(), dy_dx.float()
         
         # Data loss (MSE between predictions and ground truth)
         data_loss = torch.mean((y_pred - y_true) ** 2)
         
-        # Physics loss (PDE residuals)
-        physics_residuals = pde_func(x, y_pred)
+        # Physics loss (PDE residuals), reusing one set of output gradients
+        physics_residuals = pde_func(x, y_pred, dy_dx)
         physics_loss = torch.mean(physics_residuals ** 2)
         
         # Bias loss (ensure similar treatment for different teams)
         # Extract team-specific outputs and compare
-        team_outputs = y_pred[:, -2:] # Assuming last 2 outputs correspond to teams
-        bias_loss = torch.var(team_outputs, dim=1).mean()
+        # For two columns the unbiased variance is (a - b)^2 / 2
+        team_diff = y_pred[:, -1] - y_pred[:, -2] # Assuming last 2 outputs correspond to teams
+        bias_loss = 0.5 * (team_diff * team_diff).mean()
         
         # Buffer overflow loss (penalize exceeding buffer limits)
         buffers = x[:, 3:4]  # Buffer size from input
-        buffer_limit = 0.3
         buffer_usage = y_pred[:, 1:2]  # Effective duration from output
-        buffer_overflow = torch.clamp(buffer_usage - buffers - buffer_limit, min=0)
-        buffer_loss = torch.mean(buffer_overflow ** 2)
+        buffer_overflow = (buffer_usage - buffers).sub_(buffer_limit).relu_()
+        buffer_loss = buffer_overflow.square().mean()
         
         # Combine all loss terms
         total_loss = data_loss + physics_loss + bias_weight * bias_loss + buffer_weight * buffer_loss
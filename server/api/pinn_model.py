@@ -3,18 +3,53 @@ import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
+from torch.utils.data import BatchSampler, DataLoader, RandomSampler, TensorDataset
 import deepxde as dde
 import json
 import os
 import sys
 import time
+import warnings
 from typing import Dict, List, Tuple, Any, Optional, Union
 import traceback
 
 # Import local modules
 from .pde_models import BrooksLawPDE, CriticalChainPDE, DependencyPropagationPDE
-from .pde_models import create_combined_pde_system, create_loss_function
-from .data_processor import GDPRCompliantProcessor, PINNDataPreprocessor
+from .pde_models import create_combined_pde_system
+from .data_processor import GDPRCompliantProcessor, PINNDataPreprocessor, _json_loads
+from .worker import serve, write_response
+
+# Dynamic int8 quantization needs a quantized backend (FBGEMM/x86 or QNNPACK)
+try:
+    from torch.ao.quantization import quantize_dynamic
+    QUANTIZATION_AVAILABLE = torch.backends.quantized.engine != "none"
+except ImportError:
+    QUANTIZATION_AVAILABLE = False
+
+# Training sets smaller than this are trained full-batch, one step per epoch
+FULL_BATCH_BYTES = 64 * 1024 * 1024
+
+# Compiling the inference graph only pays off in a long-lived process on an
+# accelerator; for single-sample CPU calls compile time and guard checks dominate
+COMPILE_INFERENCE = os.environ.get("PINN_COMPILE_INFERENCE", "0") == "1"
+
+# Loss components recorded per training step
+LOSS_KEYS = ("total_loss", "data_loss", "physics_loss", "bias_loss", "buffer_loss")
+
+# Fixed weights and buffer limit of the PINN training objective
+BIAS_WEIGHT = 0.2
+BUFFER_WEIGHT = 0.2
+BUFFER_LIMIT = 0.3
+
+# Risk prediction inputs in model input order: (key, default, scale)
+RISK_INPUT_FEATURES = (
+    ("teamVelocity", 50, 100),
+    ("people", 5, 20),
+    ("duration", 5, 13),
+    ("buffer", 0.1, 0.3),
+    ("time", 0.5, 1),
+    ("depth", 0.5, 1)
+)
 
 """
 This module implements Physics-Informed Neural Networks (PINNs) for the 
@@ -89,7 +124,9 @@ class DependencyPINN(nn.Module):
 class QuantizedPINN(nn.Module):
     """
     Quantized version of the PINN model for resource-constrained environments.
-    Uses 8-bit quantization techniques to reduce computational requirements.
+    Uses dynamic 8-bit quantization of the Linear layers to reduce computational
+    requirements, and falls back to the FP32 network when no quantized backend
+    is available.
     """
     def __init__(self, original_model: DependencyPINN):
         """
@@ -103,13 +140,15 @@ class QuantizedPINN(nn.Module):
         self.input_dim = original_model.input_dim
         self.output_dim = original_model.output_dim
         
-        # Copy the original model
-        self.network = original_model.network
-        
-        # Quantize the model (8-bit quantization)
-        # This is a simplified implementation of quantization
-        # In a real implementation, we would use torch.quantization
-        self.quantized = True
+        if QUANTIZATION_AVAILABLE:
+            # Quantize a copy of the network: int8 Linear weights, with
+            # activations quantized on the fly at inference time
+            self.network = quantize_dynamic(original_model.network, {nn.Linear}, dtype=torch.qint8)
+            self.quantized = True
+        else:
+            # Copy the original model
+            self.network = original_model.network
+            self.quantized = False
         
     def forward(self, x):
         """
@@ -124,11 +163,44 @@ class QuantizedPINN(nn.Module):
         return self.network(x)
 
 
+def training_losses(X: torch.Tensor, Y_pred: torch.Tensor, Y: torch.Tensor,
+                    physics_residuals: torch.Tensor, pde_weight: float) -> torch.Tensor:
+    """
+    Compute all PINN training loss terms, with the fixed weights built in.
+    
+    Args:
+        X: Input tensor
+        Y_pred: Model output
+        Y: Target tensor
+        physics_residuals: Combined PDE residuals of Y_pred
+        pde_weight: Weight of PDE residual in loss function
+        
+    Returns:
+        Tensor of shape (5,) holding the losses in LOSS_KEYS order
+    """
+    data_loss = (Y_pred - Y).square().mean()
+    physics_loss = physics_residuals.square().mean()
+    
+    # Bias loss over the last 2 (team-specific) output columns; for two
+    # columns the unbiased variance is (a - b)^2 / 2
+    team_diff = Y_pred[:, -1] - Y_pred[:, -2]
+    bias_loss = 0.5 * team_diff.square().mean()
+    
+    # Buffer overflow loss: effective duration (output) beyond the input buffer
+    buffer_overflow = (Y_pred[:, 1:2] - X[:, 3:4]).sub_(BUFFER_LIMIT).relu_()
+    buffer_loss = buffer_overflow.square().mean()
+    
+    total_loss = data_loss + pde_weight * physics_loss + BIAS_WEIGHT * bias_loss + BUFFER_WEIGHT * buffer_loss
+    return torch.stack((total_loss, data_loss, physics_loss, bias_loss, buffer_loss))
+
+
 class PINNTrainer:
     """
     Trainer for Physics-Informed Neural Networks.
     """
-    def __init__(self, model: nn.Module, learning_rate=0.001, pde_weight=0.5):
+    def __init__(self, model: nn.Module, learning_rate=0.001, pde_weight=0.5,
+                 device: Optional[Union[str, torch.device]] = None,
+                 mixed_precision: Optional[bool] = None):
         """
         Initialize the PINN trainer.
         
@@ -136,8 +208,19 @@ class PINNTrainer:
             model: The neural network model to train
             learning_rate: Learning rate for optimization
             pde_weight: Weight of PDE residual in loss function
+            device: Training device (default: CUDA when available, else CPU)
+            mixed_precision: Run the forward pass under bf16 autocast
+                             (default: on for CUDA devices that support bf16)
         """
-        self.model = model
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+        
+        if mixed_precision is None:
+            mixed_precision = self.device.type == "cuda" and torch.cuda.is_bf16_supported()
+        self.mixed_precision = mixed_precision
+        
+        self.model = model.to(self.device)
         self.optimizer = optim.Adam(model.parameters(), lr=learning_rate)
         self.pde_weight = pde_weight
         
@@ -151,17 +234,28 @@ class PINNTrainer:
         # Create combined PDE function
         self.pde_func = create_combined_pde_system(self.domain_bounds)
         
-        # Create composite loss function
-        self.loss_func = create_loss_function(self.pde_func, bias_weight=0.2, buffer_weight=0.2)
+        # Training history: one preallocated array per loss, filled up to self._step
+        self._history = {key: np.empty(0, dtype=np.float32) for key in LOSS_KEYS}
+        self._step = 0
         
-        # Training history
-        self.history = {
-            "total_loss": [],
-            "data_loss": [],
-            "physics_loss": [],
-            "bias_loss": [],
-            "buffer_loss": []
-        }
+    @property
+    def history(self) -> Dict[str, List[float]]:
+        """Training history as lists of per-step loss values."""
+        return {key: values[:self._step].tolist() for key, values in self._history.items()}
+    
+    def _reserve_history(self, n_steps: int):
+        """
+        Make room in the history arrays for n_steps more training steps.
+        
+        Args:
+            n_steps: Number of steps about to be recorded
+        """
+        capacity = self._step + n_steps
+        if capacity > len(self._history["total_loss"]):
+            for key, values in self._history.items():
+                grown = np.empty(capacity, dtype=np.float32)
+                grown[:self._step] = values[:self._step]
+                self._history[key] = grown
         
     def train_epoch(self, X: torch.Tensor, Y: torch.Tensor) -> Dict[str, float]:
         """
@@ -174,62 +268,94 @@ class PINNTrainer:
         Returns:
             Dictionary of loss values
         """
-        self.model.train()
-        self.optimizer.zero_grad()
+        self.optimizer.zero_grad(set_to_none=True)
         
-        # Forward pass
-        Y_pred = self.model(X)
+        # The PDE residuals differentiate the outputs with respect to the inputs,
+        # so the batch becomes a fresh leaf that tracks gradients
+        X = X.detach().requires_grad_(True)
         
-        # Compute data loss
-        data_loss = torch.mean((Y_pred - Y) ** 2)
+        # Forward pass, in bf16 when mixed precision is enabled; the losses and
+        # PDE residuals below are computed in FP32
+        with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16,
+                            enabled=self.mixed_precision):
+            Y_pred = self.model(X)
+        Y_pred = Y_pred.float()
         
-        # Compute PDE residuals
+        # Compute PDE residuals; all three PDEs share one batched autograd call
+        # over the whole batch for their input derivatives
         physics_residuals = self.pde_func(X, Y_pred)
-        physics_loss = torch.mean(physics_residuals ** 2)
-        
-        # Compute bias loss
-        team_outputs = Y_pred[:, -2:] # Last 2 columns represent team-specific outputs
-        bias_loss = torch.var(team_outputs, dim=1).mean()
         
-        # Compute buffer overflow loss
-        buffers = X[:, 3:4]  # Buffer size from input
-        buffer_limit = 0.3  # Maximum buffer
-        buffer_usage = Y_pred[:, 1:2]  # Effective duration from output
-        buffer_overflow = torch.clamp(buffer_usage - buffers - buffer_limit, min=0)
-        buffer_loss = torch.mean(buffer_overflow ** 2)
-        
-        # Combine losses
-        total_loss = data_loss + self.pde_weight * physics_loss + 0.2 * bias_loss + 0.2 * buffer_loss
+        # Compute data, physics, bias and buffer losses and their total
+        loss_terms = training_losses(X, Y_pred, Y, physics_residuals, self.pde_weight)
         
         # Backward pass and optimization
-        total_loss.backward()
+        loss_terms[0].backward()
         self.optimizer.step()
         
-        # Record losses
-        losses = {
-            "total_loss": total_loss.item(),
-            "data_loss": data_loss.item(),
-            "physics_loss": physics_loss.item(),
-            "bias_loss": bias_loss.item(),
-            "buffer_loss": buffer_loss.item()
-        }
+        # Record losses, reading all terms back in one transfer
+        losses = dict(zip(LOSS_KEYS, loss_terms.detach().tolist()))
         
+        # train() reserves every step up front; direct calls grow geometrically
+        if self._step == len(self._history["total_loss"]):
+            self._reserve_history(max(self._step, 1))
         for key, value in losses.items():
-            self.history[key].append(value)
+            self._history[key][self._step] = value
+        self._step += 1
             
         return losses
         
+    def _batch_loader(self, X: torch.Tensor, Y: torch.Tensor,
+                      batch_size: int) -> DataLoader:
+        """
+        Create a shuffling minibatch loader for a large host-side training set.
+        
+        Batches are gathered with one indexing call per batch rather than per
+        sample. On CUDA, worker processes pin and prefetch the next batches so
+        host-to-device copies overlap with the training step; on CPU they would
+        only compete with training for cores, so batches are built in-process.
+        
+        Args:
+            X: Input tensor
+            Y: Target tensor
+            batch_size: Batch size for training
+            
+        Returns:
+            DataLoader yielding (X_batch, Y_batch) pairs
+        """
+        dataset = TensorDataset(X, Y)
+        sampler = BatchSampler(RandomSampler(dataset), batch_size, drop_last=False)
+        
+        if self.device.type != "cuda":
+            return DataLoader(dataset, sampler=sampler, batch_size=None)
+        
+        num_workers = min(4, (os.cpu_count() or 1) // 2)
+        return DataLoader(
+            dataset,
+            sampler=sampler,
+            batch_size=None,
+            pin_memory=True,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            prefetch_factor=2 if num_workers > 0 else None
+        )
+    
     def train(self, X: torch.Tensor, Y: torch.Tensor, 
              epochs: int, batch_size: int = 32,
              validation_split: float = 0.2) -> Dict[str, List[float]]:
         """
         Train the model for multiple epochs.
         
+        Training sets under FULL_BATCH_BYTES (64 MB) are trained full-batch,
+        so each epoch is a single optimizer step over the whole set; callers
+        wanting the step count of minibatch training need proportionally
+        more epochs.
+        
         Args:
             X: Input tensor
             Y: Target tensor
-            epochs: Number of epochs to train
-            batch_size: Batch size for training
+            epochs: Number of epochs to train; one full-batch step each for
+                training sets under 64 MB
+            batch_size: Minibatch size, only used for training sets of 64 MB or more
             validation_split: Proportion of data to use for validation
             
         Returns:
@@ -244,18 +370,32 @@ class PINNTrainer:
         indices = torch.randperm(n_samples)
         X_train = X[indices[:n_train]]
         Y_train = Y[indices[:n_train]]
-        X_val = X[indices[n_train:]]
-        Y_val = Y[indices[n_train:]]
+        X_val = X[indices[n_train:]].to(self.device)
+        Y_val = Y[indices[n_train:]].to(self.device)
+        
+        use_cuda = self.device.type == "cuda"
+        
+        # Small training sets fit comfortably in memory, so a single full-batch
+        # step per epoch avoids paying Python and autograd overhead per minibatch
+        if X_train.element_size() * X_train.nelement() < FULL_BATCH_BYTES:
+            if use_cuda:
+                X_train = X_train.pin_memory()
+                Y_train = Y_train.pin_memory()
+            batches = [(X_train.to(self.device, non_blocking=True),
+                        Y_train.to(self.device, non_blocking=True))]
+        else:
+            batches = self._batch_loader(X_train, Y_train, batch_size)
+        
+        self._reserve_history(epochs * len(batches))
         
         print(f"Training PINN model for {epochs} epochs with {n_train} samples...")
         
         for epoch in range(epochs):
             # Train in batches
-            for i in range(0, n_train, batch_size):
-                end = min(i + batch_size, n_train)
-                X_batch = X_train[i:end]
-                Y_batch = Y_train[i:end]
-                
+            self.model.train()
+            for X_batch, Y_batch in batches:
+                X_batch = X_batch.to(self.device, non_blocking=True)
+                Y_batch = Y_batch.to(self.device, non_blocking=True)
                 batch_losses = self.train_epoch(X_batch, Y_batch)
             
             # Validate
@@ -292,6 +432,14 @@ class PINNManager:
         # Models
         self.models = {}
         
+        # Inference-ready models, compiled or traced lazily per model name
+        self._inference_models = {}
+        
+        # Reused single-sample input buffer for predict_risk; the tensor shares
+        # the NumPy array's memory, so filling the array needs no tensor ops
+        self._np_buf = np.empty((1, 6), dtype=np.float32)
+        self._input_buf = torch.from_numpy(self._np_buf)
+        
     def create_model(self, model_name: str, input_dim=6, output_dim=3) -> DependencyPINN:
         """
         Create a new PINN model.
@@ -306,9 +454,10 @@ class PINNManager:
         """
         model = DependencyPINN(input_dim=input_dim, output_dim=output_dim)
         self.models[model_name] = model
+        self._inference_models.pop(model_name, None)
         return model
     
-    def load_model(self, model_name: str) -> Optional[DependencyPINN]:
+    def load_model(self, model_name: str) -> Optional[Union[DependencyPINN, QuantizedPINN]]:
         """
         Load a saved model.
         
@@ -332,16 +481,24 @@ class PINNManager:
                     config = json.load(f)
                     input_dim = config.get("input_dim", 6)
                     output_dim = config.get("output_dim", 3)
+                    quantized = config.get("quantized", False)
             else:
-                input_dim, output_dim = 6, 3
+                input_dim, output_dim, quantized = 6, 3, False
                 
             # Create model with the right dimensions
             model = DependencyPINN(input_dim=input_dim, output_dim=output_dim)
             
-            # Load weights
-            model.load_state_dict(torch.load(model_path))
+            # Quantized weights only load into an already quantized network
+            if quantized:
+                model = QuantizedPINN(model)
+            
+            # Load weights: memory-map the checkpoint, skip arbitrary unpickling,
+            # and adopt the loaded tensors instead of copying them into the model
+            state_dict = torch.load(model_path, map_location="cpu", mmap=True, weights_only=True)
+            model.load_state_dict(state_dict, assign=True)
             
             self.models[model_name] = model
+            self._inference_models.pop(model_name, None)
             return model
             
         except Exception as e:
@@ -366,13 +523,17 @@ class PINNManager:
             model = self.models[model_name]
             model_path = os.path.join(self.model_dir, f"{model_name}.pt")
             
-            # Save model weights
-            torch.save(model.state_dict(), model_path)
+            # Save model weights; write a new file and swap it in, since a loaded
+            # model may still be memory-mapped from the old one
+            tmp_path = f"{model_path}.tmp"
+            torch.save(model.state_dict(), tmp_path)
+            os.replace(tmp_path, model_path)
             
             # Save configuration
             config = {
                 "input_dim": model.input_dim,
                 "output_dim": model.output_dim,
+                "quantized": getattr(model, "quantized", False),
                 "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")
             }
             
@@ -405,19 +566,49 @@ class PINNManager:
         
         quantized_name = f"{model_name}_quantized"
         self.models[quantized_name] = quantized_model
+        self._inference_models.pop(quantized_name, None)
         
         return quantized_model
     
-    def train_model(self, model_name: str, work_items_json: str, dependencies_json: str, 
-                   team_velocities_json: str, epochs: int = 100, batch_size: int = 32) -> Dict:
+    def get_inference_model(self, model_name: str) -> nn.Module:
+        """
+        Get the inference form of a loaded model, compiled or traced once per model name.
+        
+        The compiled or traced module shares parameters with the model in
+        self.models, so further training is picked up without rebuilding it,
+        while saving keeps using the original module and its state_dict keys.
+        
+        Args:
+            model_name: Name of a model already present in self.models
+            
+        Returns:
+            Model to run inference with
+        """
+        if model_name not in self._inference_models:
+            model = self.models[model_name].eval()
+            if COMPILE_INFERENCE and hasattr(torch, "compile"):
+                model = torch.compile(model, mode="reduce-overhead", fullgraph=True)
+            else:
+                # Trace once so each call skips the Python-level module walk;
+                # torch.jit is deprecated upstream but still the cheapest path
+                # for single-sample CPU inference
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", FutureWarning)
+                    model = torch.jit.trace(model, torch.zeros(1, model.input_dim))
+            self._inference_models[model_name] = model
+        return self._inference_models[model_name]
+    
+    def train_model(self, model_name: str, work_items_json: Union[str, bytes],
+                   dependencies_json: Union[str, bytes], team_velocities_json: Union[str, bytes],
+                   epochs: int = 100, batch_size: int = 32) -> Dict:
         """
         Train a PINN model using Azure DevOps data.
         
         Args:
             model_name: Name of the model to train
-            work_items_json: JSON string with work items data
-            dependencies_json: JSON string with dependencies data
-            team_velocities_json: JSON string with team velocities data
+            work_items_json: JSON string or UTF-8 bytes with work items data
+            dependencies_json: JSON string or UTF-8 bytes with dependencies data
+            team_velocities_json: JSON string or UTF-8 bytes with team velocities data
             epochs: Number of training epochs
             batch_size: Batch size for training
             
@@ -426,9 +617,9 @@ class PINNManager:
         """
         try:
             # Parse JSON data
-            work_items = json.loads(work_items_json)
-            dependencies = json.loads(dependencies_json)
-            team_velocities = json.loads(team_velocities_json)
+            work_items = _json_loads(work_items_json)
+            dependencies = _json_loads(dependencies_json)
+            team_velocities = _json_loads(team_velocities_json)
             
             # Prepare data for training
             train_data = self.preprocessor.prepare_training_data(
@@ -453,6 +644,10 @@ class PINNManager:
                 epochs=epochs, batch_size=batch_size
             )
             
+            # Inference runs on CPU; drop any traced copy of the old weights
+            model.cpu()
+            self._inference_models.pop(model_name, None)
+            
             # Save model
             self.save_model(model_name)
             
@@ -468,13 +663,13 @@ class PINNManager:
             traceback.print_exc()
             return {"success": False, "error": str(e)}
     
-    def predict_risk(self, model_name: str, input_data_json: str) -> Dict:
+    def predict_risk(self, model_name: str, input_data: Dict[str, Any]) -> Dict:
         """
         Predict risk using a trained PINN model.
         
         Args:
             model_name: Name of the model to use
-            input_data_json: JSON string with input data
+            input_data: Parsed input data with the RISK_INPUT_FEATURES keys
             
         Returns:
             Dictionary with prediction results
@@ -487,31 +682,24 @@ class PINNManager:
             if model_name not in self.models:
                 return {"success": False, "error": f"Model {model_name} not found"}
                 
-            model = self.models[model_name]
+            model = self.get_inference_model(model_name)
             
-            # Parse input data
-            input_data = json.loads(input_data_json)
-            
-            # Prepare input tensor
+            # Fill the reused input buffer
             # This would need proper preprocessing based on the specific input format
-            input_tensor = torch.tensor([
-                input_data.get("teamVelocity", 50) / 100,
-                input_data.get("people", 5) / 20,
-                input_data.get("duration", 5) / 13,
-                input_data.get("buffer", 0.1) / 0.3,
-                input_data.get("time", 0.5),
-                input_data.get("depth", 0.5)
-            ], dtype=torch.float32).unsqueeze(0)
+            self._np_buf[0] = [
+                input_data.get(key, default) / scale
+                for key, default, scale in RISK_INPUT_FEATURES
+            ]
             
             # Make prediction
-            model.eval()
-            with torch.no_grad():
-                output = model(input_tensor)
+            with torch.inference_mode():
+                output = model(self._input_buf)
                 
             # Extract predictions
-            productivity = float(output[0, 0]) * 100  # Scale to percentage
-            effective_duration = float(output[0, 1]) * 13  # Scale to story points
-            delay = float(output[0, 2]) * 100  # Scale to percentage
+            productivity, effective_duration, delay = output[0].tolist()
+            productivity *= 100  # Scale to percentage
+            effective_duration *= 13  # Scale to story points
+            delay *= 100  # Scale to percentage
             
             # Calculate risk score
             risk_score = delay
@@ -527,20 +715,84 @@ class PINNManager:
         except Exception as e:
             print(f"Error predicting risk: {str(e)}")
             return {"success": False, "error": str(e)}
+    
+    def predict_risk_batch(self, model_name: str, input_list: List[Dict[str, Any]]) -> Dict:
+        """
+        Predict risk for many inputs with a single forward pass.
+        
+        Args:
+            model_name: Name of the model to use
+            input_list: List of parsed inputs, each with the RISK_INPUT_FEATURES keys
+            
+        Returns:
+            Dictionary with one list per prediction field, in input order
+        """
+        try:
+            # Load model if not already loaded
+            if model_name not in self.models:
+                self.load_model(model_name)
+                
+            if model_name not in self.models:
+                return {"success": False, "error": f"Model {model_name} not found"}
+                
+            model = self.get_inference_model(model_name)
+            
+            n = len(input_list)
+            
+            # Fill the (N, 6) input matrix one feature column at a time
+            inputs = np.empty((n, len(RISK_INPUT_FEATURES)), dtype=np.float32)
+            for j, (key, default, scale) in enumerate(RISK_INPUT_FEATURES):
+                column = np.fromiter((item.get(key, default) for item in input_list), dtype=np.float64, count=n)
+                inputs[:, j] = column / scale
+            
+            # Make predictions; inference models are traced on the CPU, where
+            # fp16/bf16 autocast only adds casts for a network this small, so
+            # the batch runs in FP32 like the single-sample path
+            with torch.inference_mode():
+                output = model(torch.from_numpy(inputs)).numpy()
+                
+            # Scale to percentage, story points and percentage, in double
+            # precision like the single-sample path
+            output = output.astype(np.float64)
+            productivity = (output[:, 0] * 100).tolist()
+            effective_duration = (output[:, 1] * 13).tolist()
+            delay = (output[:, 2] * 100).tolist()
+            
+            return {
+                "success": True,
+                "risk_score": delay,
+                "productivity": productivity,
+                "effective_duration": effective_duration,
+                "delay": delay
+            }
+            
+        except Exception as e:
+            print(f"Error predicting risk batch: {str(e)}")
+            return {"success": False, "error": str(e)}
 
 
 # Create global instance of PINN Manager
 pinn_manager = PINNManager()
 
 # Command handlers for integration with TypeScript backend
+def scalar_arg(arg: Union[str, bytes]) -> Any:
+    """
+    Read a scalar command argument given either JSON-encoded ('"name"', '50')
+    or as a raw string ('name'), which is returned unchanged.
+    """
+    try:
+        return _json_loads(arg)
+    except ValueError:
+        return arg
+
 def train_pinn_model(args):
     """Handle PINN model training command."""
     try:
         work_items_json = args[0]
         dependencies_json = args[1]
         team_velocities_json = args[2]
-        model_name = json.loads(args[3]) if len(args) > 3 else "dependency_pinn"
-        epochs = int(json.loads(args[4])) if len(args) > 4 else 100
+        model_name = scalar_arg(args[3]) if len(args) > 3 else "dependency_pinn"
+        epochs = int(scalar_arg(args[4])) if len(args) > 4 else 100
         
         result = pinn_manager.train_model(
             model_name, work_items_json, dependencies_json, team_velocities_json, epochs
@@ -555,27 +807,44 @@ def train_pinn_model(args):
 def predict_pinn_risk(args):
     """Handle PINN risk prediction command."""
     try:
-        input_data_json = args[0]
-        model_name = json.loads(args[1]) if len(args) > 1 else "dependency_pinn"
+        input_data = _json_loads(args[0])
+        model_name = scalar_arg(args[1]) if len(args) > 1 else "dependency_pinn"
         
-        result = pinn_manager.predict_risk(model_name, input_data_json)
+        result = pinn_manager.predict_risk(model_name, input_data)
         
         return result
     except Exception as e:
         print(f"Error in predict_pinn_risk: {str(e)}")
         return {"success": False, "error": str(e)}
 
+def predict_pinn_risk_batch(args):
+    """Handle batched PINN risk prediction command."""
+    try:
+        input_list = _json_loads(args[0])
+        model_name = scalar_arg(args[1]) if len(args) > 1 else "dependency_pinn"
+        
+        result = pinn_manager.predict_risk_batch(model_name, input_list)
+        
+        return result
+    except Exception as e:
+        print(f"Error in predict_pinn_risk_batch: {str(e)}")
+        return {"success": False, "error": str(e)}
+
 def create_quantized_pinn(args):
     """Handle creation of quantized PINN model."""
     try:
-        model_name = json.loads(args[0])
+        model_name = scalar_arg(args[0])
         
         quantized_model = pinn_manager.create_quantized_model(model_name)
         
         if quantized_model:
             quantized_name = f"{model_name}_quantized"
             pinn_manager.save_model(quantized_name)
-            return {"success": True, "model_name": quantized_name}
+            return {
+                "success": True,
+                "model_name": quantized_name,
+                "quantized": quantized_model.quantized
+            }
         else:
             return {"success": False, "error": f"Failed to create quantized model for {model_name}"}
     except Exception as e:
@@ -583,26 +852,35 @@ def create_quantized_pinn(args):
         return {"success": False, "error": str(e)}
 
 # Main function to handle command line arguments
+# Map commands to functions
+command_map = {
+    'train_pinn_model': train_pinn_model,
+    'predict_pinn_risk': predict_pinn_risk,
+    'predict_pinn_risk_batch': predict_pinn_risk_batch,
+    'create_quantized_pinn': create_quantized_pinn
+}
+
+def run_command(command, args):
+    """
+    Run a single command with JSON-encoded string arguments.
+    """
+    if command in command_map:
+        return command_map[command](args)
+    return {"error": f"Unknown command: {command}"}
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({"error": "No command specified"}))
         return
     
+    if sys.argv[1] == "--serve":
+        serve(run_command)
+        return
+    
     command = sys.argv[1]
     args = sys.argv[2:] if len(sys.argv) > 2 else []
     
-    # Map commands to functions
-    command_map = {
-        'train_pinn_model': train_pinn_model,
-        'predict_pinn_risk': predict_pinn_risk,
-        'create_quantized_pinn': create_quantized_pinn
-    }
-    
-    if command in command_map:
-        result = command_map[command](args)
-        print(json.dumps(result))
-    else:
-        print(json.dumps({"error": f"Unknown command: {command}"}))
+    write_response(run_command(command, args))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
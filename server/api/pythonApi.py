@@ -4,26 +4,53 @@ import json
 import numpy as np
 import networkx as nx
 import os
+import re
+import functools
+import hashlib
 import traceback
+from collections import OrderedDict
+from itertools import pairwise
 
-# For spaCy and scikit-learn, try to import but handle missing dependencies
+# Shared worker loop and JSON helpers; this file also runs as a plain script
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    from .worker import json_loads, serve, write_response
 except ImportError:
-    SPACY_AVAILABLE = False
+    from worker import json_loads, serve, write_response
+
+# rustworkx (Rust-backed) speeds up graph analysis; fall back to networkx without it
+try:
+    import rustworkx as rx
+    RUSTWORKX_AVAILABLE = True
+except ImportError:
+    RUSTWORKX_AVAILABLE = False
+
+# Numba compiles the CSR longest-path kernels used for large graphs
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
+# For spaCy, try to import but handle missing dependencies
 try:
-    from sklearn.ensemble import GradientBoostingRegressor
-    SKLEARN_AVAILABLE = True
+    import spacy
+    from spacy.matcher import PhraseMatcher
+    SPACY_AVAILABLE = True
 except ImportError:
-    SKLEARN_AVAILABLE = False
+    SPACY_AVAILABLE = False
 
 # Try importing the PINN modules
 try:
     import torch
     import deepxde as dde
-    from .pinn_model import pinn_manager, DependencyPINN
+    from .pinn_model import pinn_manager, DependencyPINN, scalar_arg
     from .data_processor import GDPRCompliantProcessor, PINNDataPreprocessor
     from .pde_models import BrooksLawPDE, CriticalChainPDE, DependencyPropagationPDE
     PINN_AVAILABLE = True
@@ -35,79 +62,161 @@ except Exception as e:
     traceback.print_exc()
     PINN_AVAILABLE = False
 
-# Initialize spaCy if available
+# spaCy pipeline, loaded on first use so commands that do not need it skip the load
 nlp = None
-if SPACY_AVAILABLE:
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except:
-        # Try downloading the model if not already installed
+nlp_load_attempted = False
+marker_matcher = None
+
+def load_pipeline():
+    """
+    Load en_core_web_sm with only the components dependency analysis reads.
+    
+    Only entities and sentence boundaries are used, so the tagger, attribute
+    ruler and lemmatizer are never loaded and the dependency parser is swapped
+    for the lighter sentence recognizer (or a rule-based sentencizer).
+    """
+    pipeline = spacy.load("en_core_web_sm", exclude=["tagger", "attribute_ruler", "lemmatizer"])
+    
+    if "senter" in pipeline.disabled:
+        pipeline.enable_pipe("senter")
+    if "parser" in pipeline.pipe_names:
+        pipeline.disable_pipe("parser")
+    if "senter" not in pipeline.pipe_names:
+        pipeline.add_pipe("sentencizer", first=True)
+    
+    # The shared tok2vec only feeds listening components; skip it if none remain
+    if "tok2vec" in pipeline.pipe_names:
+        listeners = pipeline.get_pipe("tok2vec").listening_components
+        if not set(listeners) & set(pipeline.pipe_names):
+            pipeline.disable_pipe("tok2vec")
+    
+    return pipeline
+
+def get_nlp():
+    """
+    Load the spaCy pipeline once per process, if spaCy is available.
+    """
+    global nlp, nlp_load_attempted, marker_matcher
+    if SPACY_AVAILABLE and not nlp_load_attempted:
+        nlp_load_attempted = True
         try:
-            import subprocess
-            subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            nlp = spacy.load("en_core_web_sm")
+            nlp = load_pipeline()
         except:
-            pass
+            # Try downloading the model if not already installed
+            try:
+                import subprocess
+                subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
+                nlp = load_pipeline()
+            except:
+                pass
+        if nlp is not None:
+            marker_matcher = build_marker_matcher(nlp)
+    return nlp
+
+def build_marker_matcher(pipeline):
+    """
+    Build a PhraseMatcher that finds every dependency marker in one pass over a Doc.
+    
+    Each marker is its own match label, so matches map straight back to the
+    marker string regardless of the casing or spacing in the text.
+    """
+    matcher = PhraseMatcher(pipeline.vocab, attr="LOWER")
+    for marker in DEPENDENCY_MARKERS:
+        matcher.add(marker, [pipeline.make_doc(marker)])
+    return matcher
+
+@functools.lru_cache(maxsize=256)
+def parse_text(text):
+    """
+    Parse text with spaCy, memoized so repeated texts skip the pipeline.
+    """
+    return get_nlp()(text)
+
+# Texts per batch when analyzing dependency texts with nlp.pipe
+NLP_BATCH_SIZE = 64
+
+# Dependency phrases, in the order they are reported
+DEPENDENCY_MARKERS = ['depends on', 'dependent on', 'blocked by', 'blocks', 
+                      'requires', 'required by', 'waiting for', 'until']
+
+# Word-bounded marker alternation and sentence splitter for the regex fast
+# path, which serves callers that do not need named entities
+MARKER_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, DEPENDENCY_MARKERS)) + r')\b', re.IGNORECASE)
+SENTENCE_PATTERN = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+
+# Very simple training data (this would be more complex in real life)
+# Format: [team_velocity, dependency_complexity, resource_allocation] -> risk_score
+RISK_TRAINING_X = np.array([
+    [10, 20, 30],  # Low risk factors -> low risk
+    [30, 40, 50],  # Medium risk factors -> medium risk
+    [70, 60, 70],  # High risk factors -> high risk
+    [90, 80, 90],  # Very high risk factors -> very high risk
+    [50, 50, 50],  # Medium everything -> medium risk
+    [20, 80, 40],  # Low velocity, high complexity -> high risk
+    [80, 20, 40],  # High velocity, low complexity -> medium-low risk
+    [40, 60, 90],  # Medium velocity, high resource issues -> high risk
+])
+
+RISK_TRAINING_Y = np.array([
+    15,   # Low risk
+    45,   # Medium risk
+    75,   # High risk
+    95,   # Very high risk
+    50,   # Medium risk
+    70,   # High risk
+    30,   # Medium-low risk
+    75    # High risk
+])
+
+# Least-squares linear fit of the training set, solved once at import:
+# (team_velocity, dependency_complexity, resource_allocation, intercept)
+RISK_COEF = tuple(float(c) for c in np.linalg.lstsq(
+    np.hstack([RISK_TRAINING_X, np.ones((len(RISK_TRAINING_X), 1))]),
+    RISK_TRAINING_Y, rcond=None)[0])
 
 # Simple trained model for risk prediction
 class RiskPredictionModel:
     def __init__(self):
-        self.model = None
-        if SKLEARN_AVAILABLE:
-            self.model = self.train_model()
-
-    def train_model(self):
-        # Very simple training data (this would be more complex in real life)
-        # Format: [team_velocity, dependency_complexity, resource_allocation] -> risk_score
-        X = np.array([
-            [10, 20, 30],  # Low risk factors -> low risk
-            [30, 40, 50],  # Medium risk factors -> medium risk
-            [70, 60, 70],  # High risk factors -> high risk
-            [90, 80, 90],  # Very high risk factors -> very high risk
-            [50, 50, 50],  # Medium everything -> medium risk
-            [20, 80, 40],  # Low velocity, high complexity -> high risk
-            [80, 20, 40],  # High velocity, low complexity -> medium-low risk
-            [40, 60, 90],  # Medium velocity, high resource issues -> high risk
-        ])
-        
-        y = np.array([
-            15,   # Low risk
-            45,   # Medium risk
-            75,   # High risk
-            95,   # Very high risk
-            50,   # Medium risk
-            70,   # High risk
-            30,   # Medium-low risk
-            75    # High risk
-        ])
-        
-        # Train a simple Gradient Boosting model
-        model = GradientBoostingRegressor(n_estimators=100, random_state=42)
-        model.fit(X, y)
-        return model
+        self.coef = RISK_COEF
     
     def predict(self, team_velocity, dependency_complexity, resource_allocation):
-        if not self.model:
-            # Fallback formula if scikit-learn is not available
-            return (0.4 * team_velocity + 0.4 * dependency_complexity + 
-                    0.2 * resource_allocation)
-            
-        # Convert to feature array and predict
-        features = np.array([[team_velocity, dependency_complexity, resource_allocation]])
-        prediction = self.model.predict(features)[0]
+        c = self.coef
+        prediction = (c[0] * team_velocity + c[1] * dependency_complexity +
+                      c[2] * resource_allocation + c[3])
         
         # Ensure prediction is within 0-100 range
-        return max(0, min(100, prediction))
+        return max(0.0, min(100.0, prediction))
+    
+    def predict_batch(self, features):
+        """
+        Predict risk for an (N, 3) array of [team_velocity, dependency_complexity,
+        resource_allocation] rows in one vectorized pass.
+        """
+        c = self.coef
+        return np.clip(features @ np.array(c[:3]) + c[3], 0.0, 100.0)
 
 # Initialize risk model
 risk_model = RiskPredictionModel()
 
 # Command handlers
+def pinn_input(factors):
+    """
+    Map a risk factor set to the input format of the PINN risk model.
+    """
+    return {
+        "teamVelocity": factors.get('teamVelocity', 50),
+        "people": factors.get('teamSize', 5),
+        "duration": factors.get('storyPoints', 5),
+        "buffer": factors.get('buffer', 0.1),
+        "time": factors.get('time', 0.5),
+        "depth": factors.get('depth', 0.5)
+    }
+
 def predict_risk(args):
     """
     Predict risk using traditional ML model.
     """
-    factors = json.loads(args[0])
+    factors = json_loads(args[0])
     team_velocity = factors.get('teamVelocity', 50)
     dependency_complexity = factors.get('dependencyComplexity', 50)
     resource_allocation = factors.get('resourceAllocation', 50)
@@ -117,18 +226,8 @@ def predict_risk(args):
     
     if use_pinn and PINN_AVAILABLE:
         try:
-            # Format the input data for PINN
-            input_data = {
-                "teamVelocity": team_velocity,
-                "people": factors.get('teamSize', 5),
-                "duration": factors.get('storyPoints', 5),
-                "buffer": factors.get('buffer', 0.1),
-                "time": factors.get('time', 0.5),
-                "depth": factors.get('depth', 0.5)
-            }
-            
             # Use PINN for prediction
-            pinn_result = pinn_manager.predict_risk("dependency_pinn", json.dumps(input_data))
+            pinn_result = pinn_manager.predict_risk("dependency_pinn", pinn_input(factors))
             
             if pinn_result.get("success", False):
                 return {
@@ -151,6 +250,67 @@ def predict_risk(args):
         'usedFallback': use_pinn and PINN_AVAILABLE  # True if PINN was requested but failed
     }
 
+def risk_features(factors_list):
+    """
+    Build the (N, 3) traditional risk feature matrix, one column at a time.
+    """
+    n = len(factors_list)
+    features = np.empty((n, 3))
+    for j, key in enumerate(('teamVelocity', 'dependencyComplexity', 'resourceAllocation')):
+        features[:, j] = np.fromiter((f.get(key, 50) for f in factors_list), dtype=np.float64, count=n)
+    return features
+
+def predict_risk_batch(args):
+    """
+    Predict risk for a list of factor sets using the traditional model.
+    """
+    factors_list = json_loads(args[0])
+    return {
+        'risk': risk_model.predict_batch(risk_features(factors_list)).tolist(),
+        'model': 'traditional'
+    }
+
+def predict_risk_pinn_batch(args):
+    """
+    Predict risk for a list of factor sets with the PINN model in one forward pass.
+    """
+    factors_list = json_loads(args[0])
+    
+    if PINN_AVAILABLE:
+        try:
+            # Format the input data for PINN and run the shared batch path
+            input_list = [pinn_input(f) for f in factors_list]
+            pinn_result = pinn_manager.predict_risk_batch("dependency_pinn", input_list)
+            
+            if pinn_result.get("success", False):
+                return {
+                    'results': [
+                        {
+                            'risk': risk,
+                            'productivity': productivity,
+                            'effectiveDuration': effective_duration,
+                            'delay': delay,
+                            'model': 'pinn',
+                            'usedFallback': False
+                        }
+                        for risk, productivity, effective_duration, delay in zip(
+                            pinn_result["risk_score"], pinn_result["productivity"],
+                            pinn_result["effective_duration"], pinn_result["delay"])
+                    ]
+                }
+        except Exception as e:
+            print(f"PINN batch prediction failed, falling back to traditional model: {e}", file=sys.stderr)
+            traceback.print_exc()
+    
+    # Fall back to traditional risk model
+    risks = risk_model.predict_batch(risk_features(factors_list)).tolist()
+    return {
+        'results': [
+            {'risk': risk, 'model': 'traditional', 'usedFallback': PINN_AVAILABLE}
+            for risk in risks
+        ]
+    }
+
 def train_pinn_model(args):
     """
     Train a PINN model using work items, dependencies, and team velocity data.
@@ -167,8 +327,8 @@ def train_pinn_model(args):
         team_velocities_json = args[2]
         
         # Optional arguments
-        model_name = json.loads(args[3]) if len(args) > 3 else "dependency_pinn"
-        epochs = int(json.loads(args[4])) if len(args) > 4 else 50
+        model_name = scalar_arg(args[3]) if len(args) > 3 else "dependency_pinn"
+        epochs = int(scalar_arg(args[4])) if len(args) > 4 else 50
         
         # Call PINN manager to train model
         result = pinn_manager.train_model(
@@ -180,57 +340,78 @@ def train_pinn_model(args):
         traceback.print_exc()
         return {'success': False, 'error': f'Error training PINN model: {str(e)}'}
 
-def analyze_dependency(args):
+def text_marker_sentences(text):
     """
-    Analyze dependency text using NLP.
+    Find the sentences containing each dependency marker with regular expressions.
+    """
+    marker_sentences = {}
+    if MARKER_PATTERN.search(text):
+        for sent_match in SENTENCE_PATTERN.finditer(text):
+            sentence = sent_match.group().strip()
+            for marker in set(m.lower() for m in MARKER_PATTERN.findall(sentence)):
+                marker_sentences.setdefault(marker, []).append(sentence)
+    return marker_sentences
+
+def doc_marker_sentences(doc):
     """
-    text = json.loads(args[0])
+    Find the sentences containing each dependency marker in a parsed spaCy Doc.
+    """
+    # Matches come in document order, so each marker's sentences stay in order
+    marker_sentences = {}
+    seen = set()
+    for match_id, start, end in marker_matcher(doc):
+        marker = doc.vocab.strings[match_id]
+        sent = doc[start].sent
+        if (marker, sent.start) not in seen:
+            seen.add((marker, sent.start))
+            marker_sentences.setdefault(marker, []).append(sent.text)
+    return marker_sentences
+
+def dependency_results(text, doc=None):
+    """
+    Build the dependency analysis for one text.
     
-    if not SPACY_AVAILABLE or not nlp:
-        # Fallback basic analysis
-        results = {
-            'entities': [],
-            'dependencies': [],
-            'has_dependency_markers': 'depends' in text.lower() or 'blocked' in text.lower() or 'requires' in text.lower()
-        }
-    else:
-        # Use spaCy for NLP analysis
-        doc = nlp(text)
+    Args:
+        text: Raw text
+        doc: spaCy Doc for the text, or None to skip NER and find markers
+            with the regex fast path
         
-        # Extract entities
+    Returns:
+        Dictionary with entities, dependency sentences and marker flag
+    """
+    if doc is None:
+        entities = []
+        marker_sentences = text_marker_sentences(text)
+    else:
         entities = [{'text': ent.text, 'label': ent.label_} for ent in doc.ents]
-        
-        # Look for dependency phrases
-        dependency_markers = ['depends on', 'dependent on', 'blocked by', 'blocks', 
-                             'requires', 'required by', 'waiting for', 'until']
-        
-        dependencies = []
-        for marker in dependency_markers:
-            if marker in text.lower():
-                # Find sentences containing the marker
-                for sent in doc.sents:
-                    if marker in sent.text.lower():
-                        dependencies.append({
-                            'marker': marker,
-                            'sentence': sent.text
-                        })
-        
-        results = {
-            'entities': entities,
-            'dependencies': dependencies,
-            'has_dependency_markers': len(dependencies) > 0
-        }
+        marker_sentences = doc_marker_sentences(doc)
+    
+    dependencies = [
+        {'marker': marker, 'sentence': sentence}
+        for marker in DEPENDENCY_MARKERS
+        for sentence in marker_sentences.get(marker, [])
+    ]
+    
+    results = {
+        'entities': entities,
+        'dependencies': dependencies,
+        'has_dependency_markers': len(dependencies) > 0
+    }
     
     # If PINN is available, enrich the analysis with physics-based insights
     if PINN_AVAILABLE and len(results['dependencies']) > 0:
         try:
+            # Lowered once, and only for texts that get insights; the keyword
+            # checks stop at the first hit
+            lower_text = text.lower()
+            
             # Get additional insights based on physics models
             results['physics_insights'] = {
-                'has_critical_chain_impact': any(m in text.lower() for m in ['deadline', 'critical', 'timeline']),
-                'has_brooks_law_indicators': any(m in text.lower() for m in ['team', 'resource', 'staff', 'personnel']),
+                'has_critical_chain_impact': any(m in lower_text for m in ('deadline', 'critical', 'timeline')),
+                'has_brooks_law_indicators': any(m in lower_text for m in ('team', 'resource', 'staff', 'personnel')),
                 'delay_risk_factors': [
                     d['marker'] for d in results['dependencies']
-                    if d['marker'] in ['blocked by', 'waiting for', 'until']
+                    if d['marker'] in ('blocked by', 'waiting for', 'until')
                 ]
             }
         except Exception as e:
@@ -238,17 +419,419 @@ def analyze_dependency(args):
     
     return results
 
+def needs_entities(args, index):
+    """
+    Read the needEntities option; without it the spaCy pipeline is never run.
+    """
+    options = json_loads(args[index]) if len(args) > index else {}
+    return bool(options and options.get('needEntities', False))
+
+def analyze_dependency(args):
+    """
+    Analyze dependency text using NLP.
+    """
+    text = json_loads(args[0])
+    
+    if not needs_entities(args, 1) or not get_nlp():
+        return dependency_results(text)
+    
+    # Use spaCy for NLP analysis
+    return dependency_results(text, parse_text(text))
+
+def analyze_dependency_batch(args):
+    """
+    Analyze a list of dependency texts, streaming them through spaCy in batches.
+    """
+    texts = json_loads(args[0])
+    
+    nlp = get_nlp() if needs_entities(args, 1) else None
+    if not nlp:
+        return {'results': [dependency_results(text) for text in texts]}
+    
+    # nlp.pipe amortizes per-call pipeline overhead across each batch
+    docs = nlp.pipe(texts, batch_size=NLP_BATCH_SIZE)
+    return {'results': [dependency_results(text, doc) for text, doc in zip(texts, docs)]}
+
+# Recently built dependency graphs, keyed by their nodes and weighted edges
+# (or by the digest of the request payload they were parsed from)
+GRAPH_CACHE_SIZE = 8
+graph_cache = OrderedDict()
+
+# Recently parsed node and edge payloads, keyed by a digest of their JSON
+payload_cache = OrderedDict()
+
+def parse_graph_payload(nodes_json, edges_json):
+    """
+    Parse the nodes and edges arguments, reusing the objects for repeated payloads.
+    
+    Returns the nodes, the edges and a digest of the raw payload that
+    identifies the graph in graph_cache. The returned objects are shared
+    between calls and must not be modified.
+    """
+    raw = [arg.encode() if isinstance(arg, str) else arg for arg in (nodes_json, edges_json)]
+    digest = hashlib.blake2b(raw[0] + b'\0' + raw[1], digest_size=16).digest()
+    payload = payload_cache.get(digest)
+    if payload is not None:
+        payload_cache.move_to_end(digest)
+        return payload
+    
+    payload = (json_loads(nodes_json), json_loads(edges_json), digest)
+    payload_cache[digest] = payload
+    if len(payload_cache) > GRAPH_CACHE_SIZE:
+        payload_cache.popitem(last=False)
+    return payload
+
+def cached_graph(backend, nodes, edges, build, graph_key=None):
+    """
+    Look up a graph built by build(nodes, weighted_edges), building it on a miss.
+    
+    graph_key identifies the nodes and edges when known (e.g. a payload
+    digest); otherwise the key is built from their contents.
+    """
+    weighted_edges = None
+    if graph_key is None:
+        weighted_edges = tuple((edge['source'], edge['target'], edge['weight']) for edge in edges)
+        graph_key = (tuple(nodes), weighted_edges)
+    key = (backend, graph_key)
+    graph = graph_cache.get(key)
+    if graph is not None:
+        graph_cache.move_to_end(key)
+        return graph
+    
+    if weighted_edges is None:
+        weighted_edges = tuple((edge['source'], edge['target'], edge['weight']) for edge in edges)
+    graph = build(nodes, weighted_edges)
+    graph_cache[key] = graph
+    if len(graph_cache) > GRAPH_CACHE_SIZE:
+        graph_cache.popitem(last=False)
+    return graph
+
+def build_graph(nodes, edges, graph_key=None):
+    """
+    Build the weighted dependency graph, reusing it for repeated requests.
+    
+    The returned graph is shared between calls and must not be modified;
+    copy it first if edges need to be removed.
+    """
+    def build(nodes, weighted_edges):
+        G = nx.DiGraph()
+        G.add_nodes_from(nodes)
+        G.add_weighted_edges_from(weighted_edges)
+        return G
+    
+    return cached_graph('networkx', nodes, edges, build, graph_key)
+
+def build_rx_graph(nodes, edges, graph_key=None):
+    """
+    Build the weighted dependency graph as a shared rustworkx PyDiGraph.
+    
+    Node payloads are the work item ids and edge payloads the weights.
+    Returns the graph, a map from work item id to node index, and whether
+    every edge weight is non-negative.
+    """
+    def build(nodes, weighted_edges):
+        # Like networkx, add nodes that only appear in edges and let the
+        # last duplicate edge win
+        node_ids = list(dict.fromkeys(
+            list(nodes) + [node for source, target, _ in weighted_edges for node in (source, target)]
+        ))
+        G = rx.PyDiGraph(multigraph=False)
+        index_of = dict(zip(node_ids, G.add_nodes_from(node_ids)))
+        G.add_edges_from([(index_of[source], index_of[target], weight) for source, target, weight in weighted_edges])
+        nonnegative = all(weight >= 0 for _, _, weight in weighted_edges)
+        return G, index_of, nonnegative
+    
+    return cached_graph('rustworkx', nodes, edges, build, graph_key)
+
+def edge_weight(source, target, weight):
+    """Edge weight callback for rustworkx path functions."""
+    return weight
+
+def rx_critical_path(nodes, edges, graph_key=None):
+    """
+    Find the heaviest path with rustworkx.
+    
+    Returns (path, total weight), or None when the graph has cycles or
+    negative weights and needs the networkx implementation.
+    """
+    G, _, nonnegative = build_rx_graph(nodes, edges, graph_key)
+    if not nonnegative or not rx.is_directed_acyclic_graph(G):
+        return None
+    
+    indices = rx.dag_weighted_longest_path(G, edge_weight)
+    path_weight = sum(G.get_edge_data(u, v) for u, v in pairwise(indices))
+    return [G[index] for index in indices], path_weight
+
+def rx_cascade_impact(work_item_id, nodes, edges, graph_key=None):
+    """
+    Find the items affected by a delayed work item and the longest delay with rustworkx.
+    
+    Returns (affected items, total delay), or None when the affected subgraph
+    has cycles or negative weights and needs the networkx implementation.
+    """
+    G, index_of, nonnegative = build_rx_graph(nodes, edges, graph_key)
+    if work_item_id not in index_of:
+        raise nx.NetworkXError(f"The node {work_item_id} is not in the digraph.")
+    
+    source = index_of[work_item_id]
+    descendants = rx.descendants(G, source)
+    affected_items = [G[index] for index in descendants]
+    if not descendants:
+        return affected_items, 0
+    
+    reachable = G.subgraph([source, *descendants])
+    if not nonnegative or not rx.is_directed_acyclic_graph(reachable):
+        return None
+    
+    # The work item is the only root of its reachable DAG, so with
+    # non-negative weights the heaviest path there starts at it
+    indices = rx.dag_weighted_longest_path(reachable, edge_weight)
+    total_delay = sum(reachable.get_edge_data(u, v) for u, v in pairwise(indices))
+    return affected_items, total_delay
+
+# Edge count from which the Numba CSR kernels beat networkx, if rustworkx is missing
+NUMBA_GRAPH_THRESHOLD = 5000
+
+def csr_arrays(rows, cols, weights, n):
+    """
+    Pack (row, col, weight) edges into CSR arrays grouped by row.
+    
+    Returns indptr, the column of each edge, and the weight of each edge.
+    """
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order], weights[order]
+
+@njit(cache=True)
+def topological_layers(indptr, indices, n):
+    """
+    Kahn's algorithm over a CSR successor list.
+    
+    Returns the nodes in topological order and the start offset of each
+    layer of mutually independent nodes; on a cyclic graph the order is
+    shorter than n.
+    """
+    indegree = np.zeros(n, dtype=np.int64)
+    for e in range(indices.shape[0]):
+        indegree[indices[e]] += 1
+    
+    order = np.empty(n, dtype=np.int64)
+    layer_starts = np.empty(n + 1, dtype=np.int64)
+    count = 0
+    for v in range(n):
+        if indegree[v] == 0:
+            order[count] = v
+            count += 1
+    
+    n_layers = 0
+    start = 0
+    while start < count:
+        layer_starts[n_layers] = start
+        n_layers += 1
+        end = count
+        for k in range(start, end):
+            u = order[k]
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order[count] = v
+                    count += 1
+        start = end
+    layer_starts[n_layers] = count
+    return order[:count], layer_starts[:n_layers + 1]
+
+@njit(parallel=True, cache=True)
+def layered_longest_paths(order, layer_starts, pred_indptr, pred_indices, pred_weights, dist, parent):
+    """
+    Longest-path DP over topological layers, updating dist and parent in place.
+    
+    Nodes of one layer only read distances from earlier layers, so each layer
+    is relaxed in parallel, every node pulling from its own predecessors.
+    dist holds each node's starting distance (0 to start anywhere, -inf for
+    nodes that cannot start a path).
+    """
+    for layer in range(layer_starts.shape[0] - 1):
+        for k in prange(layer_starts[layer], layer_starts[layer + 1]):
+            v = order[k]
+            best = dist[v]
+            best_parent = v
+            for e in range(pred_indptr[v], pred_indptr[v + 1]):
+                candidate = dist[pred_indices[e]] + pred_weights[e]
+                if candidate > best:
+                    best = candidate
+                    best_parent = pred_indices[e]
+            dist[v] = best
+            parent[v] = best_parent
+
+def build_csr_graph(nodes, edges, graph_key=None):
+    """
+    Build the weighted dependency graph as shared CSR arrays in topological layers.
+    """
+    def build(nodes, weighted_edges):
+        # Like networkx, add nodes that only appear in edges and let the
+        # last duplicate edge win
+        node_ids = list(dict.fromkeys(
+            list(nodes) + [node for source, target, _ in weighted_edges for node in (source, target)]
+        ))
+        index_of = {node: index for index, node in enumerate(node_ids)}
+        edge_weights = {(index_of[source], index_of[target]): weight for source, target, weight in weighted_edges}
+        
+        n, m = len(node_ids), len(edge_weights)
+        sources = np.fromiter((source for source, _ in edge_weights), dtype=np.int64, count=m)
+        targets = np.fromiter((target for _, target in edge_weights), dtype=np.int64, count=m)
+        # Keep the weights' own types (int64 for integer weights, objects for a
+        # mix of ints and floats) so path totals add up exactly as networkx's
+        values = list(edge_weights.values())
+        weights = np.array(values)
+        if weights.dtype.kind not in 'iu' and not all(type(value) is float for value in values):
+            weights = np.array(values, dtype=object)
+        
+        # Only the flat arrays are kept; the per-edge dict is dropped after the build
+        succ_indptr, succ_indices, _ = csr_arrays(sources, targets, weights, n)
+        pred_indptr, pred_indices, pred_values = csr_arrays(targets, sources, weights, n)
+        order, layer_starts = topological_layers(succ_indptr, succ_indices, n)
+        return {
+            'node_ids': node_ids,
+            'index_of': index_of,
+            'is_dag': len(order) == n,
+            'order': order,
+            'layer_starts': layer_starts,
+            'pred_indptr': pred_indptr,
+            'pred_indices': pred_indices,
+            'pred_values': pred_values,
+            'pred_weights': pred_values.astype(np.float64)
+        }
+    
+    return cached_graph('csr', nodes, edges, build, graph_key)
+
+def csr_longest_path(graph, dist):
+    """
+    Run the layered DP from the given starting distances and trace back the heaviest path.
+    
+    Returns the path as node indices and its weight summed from the original
+    edge weights.
+    """
+    parent = np.empty(len(dist), dtype=np.int64)
+    layered_longest_paths(graph['order'], graph['layer_starts'], graph['pred_indptr'],
+                          graph['pred_indices'], graph['pred_weights'], dist, parent)
+    
+    v = int(np.argmax(dist))
+    path = [v]
+    while parent[v] != v:
+        v = int(parent[v])
+        path.append(v)
+    path.reverse()
+    return path, csr_path_weight(graph, path)
+
+def csr_path_weight(graph, path):
+    """
+    Sum the original edge weights along a path of node indices.
+    """
+    pred_indptr, pred_indices = graph['pred_indptr'], graph['pred_indices']
+    edge_ids = []
+    for u, v in pairwise(path):
+        start = pred_indptr[v]
+        edge_ids.append(start + np.flatnonzero(pred_indices[start:pred_indptr[v + 1]] == u)[0])
+    return sum(graph['pred_values'][edge_ids].tolist())
+
+def csr_critical_path(nodes, edges, graph_key=None):
+    """
+    Find the heaviest path with the Numba CSR kernels.
+    
+    Returns (path, total weight), or None when the graph has cycles and needs
+    the networkx implementation.
+    """
+    graph = build_csr_graph(nodes, edges, graph_key)
+    if not graph['is_dag']:
+        return None
+    if not graph['node_ids']:
+        return [], 0
+    
+    # Like networkx, a path may start at any node
+    path, path_weight = csr_longest_path(graph, np.zeros(len(graph['node_ids'])))
+    return [graph['node_ids'][index] for index in path], path_weight
+
+def csr_cascade_impact(work_item_id, nodes, edges, graph_key=None):
+    """
+    Find the items affected by a delayed work item and the longest delay with the Numba CSR kernels.
+    
+    Returns (affected items, total delay), or None when the graph has cycles
+    and needs the networkx implementation.
+    """
+    graph = build_csr_graph(nodes, edges, graph_key)
+    node_ids = graph['node_ids']
+    if work_item_id not in graph['index_of']:
+        raise nx.NetworkXError(f"The node {work_item_id} is not in the digraph.")
+    if not graph['is_dag']:
+        return None
+    
+    # Paths may only start at the work item; unreachable nodes stay at -inf
+    source = graph['index_of'][work_item_id]
+    dist = np.full(len(node_ids), -np.inf)
+    dist[source] = 0
+    _, total_delay = csr_longest_path(graph, dist)
+    
+    affected_items = [node_ids[index] for index in np.flatnonzero(np.isfinite(dist)) if index != source]
+    return affected_items, max(0, total_delay)
+
+def fast_critical_path(nodes, edges, graph_key=None):
+    """
+    Find the heaviest path with rustworkx or, for large graphs, the Numba CSR kernels.
+    
+    Returns (path, total weight), or None when networkx has to handle the graph.
+    """
+    if RUSTWORKX_AVAILABLE:
+        result = rx_critical_path(nodes, edges, graph_key)
+        if result is not None:
+            return result
+    if NUMBA_AVAILABLE and len(edges) >= NUMBA_GRAPH_THRESHOLD:
+        return csr_critical_path(nodes, edges, graph_key)
+    return None
+
+def fast_cascade_impact(work_item_id, nodes, edges, graph_key=None):
+    """
+    Compute the cascade impact with rustworkx or, for large graphs, the Numba CSR kernels.
+    
+    Returns (affected items, total delay), or None when networkx has to handle the graph.
+    """
+    if RUSTWORKX_AVAILABLE:
+        result = rx_cascade_impact(work_item_id, nodes, edges, graph_key)
+        if result is not None:
+            return result
+    if NUMBA_AVAILABLE and len(edges) >= NUMBA_GRAPH_THRESHOLD:
+        return csr_cascade_impact(work_item_id, nodes, edges, graph_key)
+    return None
+
+def critical_path_result(critical_path, path_weight, use_pinn):
+    """
+    Format the critical path response.
+    """
+    # Find path with maximum total weight
+    if len(critical_path) > 1:
+        result = {
+            'path': list(critical_path),
+            'totalWeight': path_weight
+        }
+        
+        if use_pinn and PINN_AVAILABLE:
+            result['usedPINN'] = True
+            
+        return result
+    else:
+        return {'path': [], 'totalWeight': 0}
+
 def find_critical_path(args):
     """
     Find the critical path in a dependency network.
     """
-    nodes = json.loads(args[0])
-    edges = json.loads(args[1])
+    nodes, edges, graph_key = parse_graph_payload(args[0], args[1])
     
     # Check if we should use PINN for critical path analysis
     use_pinn = False
     if len(args) > 2:
-        options = json.loads(args[2])
+        options = json_loads(args[2])
         use_pinn = options.get('usePINN', False)
     
     # If PINN is available and requested, use PINN-enhanced critical path analysis
@@ -274,69 +857,37 @@ def find_critical_path(args):
                 
             # Use the enhanced edges for critical path analysis
             edges = physics_edges
+            graph_key = (graph_key, 'physics')
         except Exception as e:
             print(f"Error applying PINN enhancement to critical path: {e}", file=sys.stderr)
             traceback.print_exc()
     
-    # Create directed graph
-    G = nx.DiGraph()
-    
-    # Add nodes
-    for node_id in nodes:
-        G.add_node(node_id)
-    
-    # Add edges with weights
-    for edge in edges:
-        G.add_edge(edge['source'], edge['target'], weight=edge['weight'])
-    
     # Find critical path using longest path in DAG
     try:
-        # Check if graph is a DAG
+        fast_result = fast_critical_path(nodes, edges, graph_key)
+        if fast_result is not None:
+            critical_path, path_weight = fast_result
+            return critical_path_result(critical_path, path_weight, use_pinn)
+        
+        # Create directed graph, shared with other commands on the same network
+        G = build_graph(nodes, edges, graph_key)
+        
+        # Handle cycles by removing the lowest-weight edge of one cycle at a time until DAG
         if not nx.is_directed_acyclic_graph(G):
-            # Handle cycles by removing edges with lowest weight until DAG
-            while not nx.is_directed_acyclic_graph(G):
-                cycles = list(nx.simple_cycles(G))
-                if not cycles:
+            # Break cycles on a copy so the shared graph stays intact
+            G = G.copy()
+            while True:
+                try:
+                    cycle = nx.find_cycle(G)
+                except nx.NetworkXNoCycle:
                     break
-                    
-                # Find the edge with minimum weight in the cycle
-                min_weight = float('inf')
-                min_edge = None
-                
-                for u, v in zip(cycles[0], cycles[0][1:] + [cycles[0][0]]):
-                    if G.has_edge(u, v) and G[u][v]['weight'] < min_weight:
-                        min_weight = G[u][v]['weight']
-                        min_edge = (u, v)
-                
-                if min_edge:
-                    G.remove_edge(*min_edge)
+                min_edge = min(cycle, key=lambda edge: G[edge[0]][edge[1]]['weight'])
+                G.remove_edge(*min_edge)
         
-        # Find all paths
-        all_paths = []
-        for source in G.nodes():
-            for target in G.nodes():
-                if source != target:
-                    try:
-                        for path in nx.all_simple_paths(G, source, target):
-                            path_weight = sum(G[u][v]['weight'] for u, v in zip(path[:-1], path[1:]))
-                            all_paths.append((path, path_weight))
-                    except nx.NetworkXNoPath:
-                        continue
-        
-        # Find path with maximum total weight
-        if all_paths:
-            critical_path, path_weight = max(all_paths, key=lambda x: x[1])
-            result = {
-                'path': list(critical_path),
-                'totalWeight': path_weight
-            }
-            
-            if use_pinn and PINN_AVAILABLE:
-                result['usedPINN'] = True
-                
-            return result
-        else:
-            return {'path': [], 'totalWeight': 0}
+        # The heaviest path in a DAG follows from one dynamic-programming pass in topological order
+        critical_path = nx.dag_longest_path(G, weight='weight', default_weight=0)
+        path_weight = sum(G[u][v]['weight'] for u, v in pairwise(critical_path))
+        return critical_path_result(critical_path, path_weight, use_pinn)
     except Exception as e:
         print(f"Error finding critical path: {str(e)}", file=sys.stderr)
         traceback.print_exc()
@@ -346,46 +897,56 @@ def calculate_cascade_impact(args):
     """
     Calculate the cascade impact of a work item delay.
     """
-    work_item_id = json.loads(args[0])
-    nodes = json.loads(args[1])
-    edges = json.loads(args[2])
+    work_item_id = json_loads(args[0])
+    nodes, edges, graph_key = parse_graph_payload(args[1], args[2])
     
     # Check if we should use PINN for impact analysis
     use_pinn = False
     if len(args) > 3:
-        options = json.loads(args[3])
+        options = json_loads(args[3])
         use_pinn = options.get('usePINN', False)
     
-    # Create directed graph
-    G = nx.DiGraph()
-    
-    # Add nodes
-    for node_id in nodes:
-        G.add_node(node_id)
-    
-    # Add edges with weights
-    for edge in edges:
-        G.add_edge(edge['source'], edge['target'], weight=edge['weight'])
-    
     # Calculate impact
     try:
-        # Find all descendants (affected items)
-        affected_items = list(nx.descendants(G, work_item_id))
-        
-        # Calculate total delay as sum of weights of all paths
-        total_delay = 0
-        for target in affected_items:
-            try:
-                # Find the longest path (most delay) to this target
-                paths = list(nx.all_simple_paths(G, work_item_id, target))
-                if paths:
-                    path_weights = [
-                        sum(G[u][v]['weight'] for u, v in zip(path[:-1], path[1:]))
-                        for path in paths
-                    ]
-                    total_delay = max(total_delay, max(path_weights))
-            except nx.NetworkXNoPath:
-                continue
+        fast_result = fast_cascade_impact(work_item_id, nodes, edges, graph_key)
+        if fast_result is not None:
+            affected_items, total_delay = fast_result
+        else:
+            # Create directed graph, shared with other commands on the same network
+            G = build_graph(nodes, edges, graph_key)
+            
+            # Find all descendants (affected items)
+            affected_items = list(nx.descendants(G, work_item_id))
+            
+            # Calculate total delay as the weight of the longest path to any affected item
+            total_delay = 0
+            reachable = G.subgraph(affected_items + [work_item_id])
+            if nx.is_directed_acyclic_graph(reachable):
+                # Relax edges once in topological order; every node is reachable from
+                # the work item, so its predecessors are always settled first
+                delay_to = {work_item_id: 0}
+                for u in nx.topological_sort(reachable):
+                    for v, data in reachable[u].items():
+                        delay = delay_to[u] + data['weight']
+                        if delay > delay_to.get(v, float('-inf')):
+                            delay_to[v] = delay
+                total_delay = max(total_delay, max(delay_to.values()))
+            else:
+                # Longest simple paths through cycles have no DP shortcut; look
+                # edge weights up in one flat dict while summing each path
+                weights = {(u, v): w for u, v, w in reachable.edges(data='weight')}
+                for target in affected_items:
+                    try:
+                        # Find the longest path (most delay) to this target
+                        paths = list(nx.all_simple_paths(G, work_item_id, target))
+                        if paths:
+                            path_weights = [
+                                sum(map(weights.__getitem__, pairwise(path)))
+                                for path in paths
+                            ]
+                            total_delay = max(total_delay, max(path_weights))
+                    except nx.NetworkXNoPath:
+                        continue
         
         result = {
             'affected_items': affected_items,
@@ -437,7 +998,7 @@ def quantize_model(args):
         return {'success': False, 'error': 'PINN dependencies not available'}
     
     try:
-        model_name = json.loads(args[0])
+        model_name = scalar_arg(args[0])
         
         # Create quantized model
         result = pinn_manager.create_quantized_model(model_name)
@@ -460,18 +1021,19 @@ def anonymize_data(args):
     
     try:
         data_json = args[0]
-        data = json.loads(data_json)
+        data = json_loads(data_json)
         
         # Get fields to anonymize
-        fields_to_anonymize = json.loads(args[1]) if len(args) > 1 else None
+        fields_to_anonymize = json_loads(args[1]) if len(args) > 1 else None
         
         # Create GDPR processor
         gdpr_processor = GDPRCompliantProcessor(anonymize_fields=fields_to_anonymize)
         
         # Process data type accordingly
         if isinstance(data, list):
-            # Assume list of work items
-            anonymized_data = [gdpr_processor.anonymize_work_item(item) for item in data]
+            # Assume list of work items; all values are hashed in one batch,
+            # large batches across a thread pool
+            anonymized_data = gdpr_processor.anonymize_work_items(data)
         elif isinstance(data, dict):
             # Assume single work item
             anonymized_data = gdpr_processor.anonymize_work_item(data)
@@ -488,31 +1050,42 @@ def anonymize_data(args):
         traceback.print_exc()
         return {'success': False, 'error': f'Error anonymizing data: {str(e)}'}
 
+# Map commands to functions
+command_map = {
+    'predict_risk': predict_risk,
+    'predict_risk_batch': predict_risk_batch,
+    'predict_risk_pinn_batch': predict_risk_pinn_batch,
+    'train_pinn_model': train_pinn_model,
+    'analyze_dependency': analyze_dependency,
+    'analyze_dependency_batch': analyze_dependency_batch,
+    'find_critical_path': find_critical_path,
+    'calculate_cascade_impact': calculate_cascade_impact,
+    'quantize_model': quantize_model,
+    'anonymize_data': anonymize_data
+}
+
+def run_command(command, args):
+    """
+    Run a single command with JSON-encoded string arguments.
+    """
+    if command in command_map:
+        return command_map[command](args)
+    return {"error": f"Unknown command: {command}"}
+
 # Main function to handle command line arguments
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({"error": "No command specified"}))
         return
     
+    if sys.argv[1] == "--serve":
+        serve(run_command)
+        return
+    
     command = sys.argv[1]
     args = sys.argv[2:] if len(sys.argv) > 2 else []
     
-    # Map commands to functions
-    command_map = {
-        'predict_risk': predict_risk,
-        'train_pinn_model': train_pinn_model,
-        'analyze_dependency': analyze_dependency,
-        'find_critical_path': find_critical_path,
-        'calculate_cascade_impact': calculate_cascade_impact,
-        'quantize_model': quantize_model,
-        'anonymize_data': anonymize_data
-    }
-    
-    if command in command_map:
-        result = command_map[command](args)
-        print(json.dumps(result))
-    else:
-        print(json.dumps({"error": f"Unknown command: {command}"}))
+    write_response(run_command(command, args))
 
 if __name__ == "__main__":
     main()
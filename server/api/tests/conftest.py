@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The Python API is the `api` namespace package under server/; make it importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
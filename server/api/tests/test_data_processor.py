@@ -0,0 +1,42 @@
+import numpy as np
+
+from api.data_processor import PINNDataPreprocessor
+
+
+def items(*ids):
+    return [{"id": item_id} for item_id in ids]
+
+
+def deps(*pairs):
+    return [{"sourceId": source, "targetId": target} for source, target in pairs]
+
+
+def test_dependency_depths_dag():
+    # 1 -> 2 -> 3 -> 4 and 1 -> 5 -> 4: the longest chain below 1 has three hops
+    depths = PINNDataPreprocessor()._dependency_depths(
+        items(1, 2, 3, 4, 5, 6),
+        deps((1, 2), (2, 3), (3, 4), (1, 5), (5, 4))
+    )
+    np.testing.assert_array_equal(depths, [3, 2, 1, 0, 1, 0])
+
+
+def test_dependency_depths_cycle():
+    # 2 <-> 3 is a cycle: its nodes and everything below them keep depth 0,
+    # while 1 still counts the hop onto the cycle
+    depths = PINNDataPreprocessor()._dependency_depths(
+        items(1, 2, 3, 4, 5),
+        deps((1, 2), (2, 3), (3, 2), (3, 4))
+    )
+    np.testing.assert_array_equal(depths, [1, 0, 0, 0, 0])
+
+
+def test_denormalize_round_trip_with_constant_column():
+    processor = PINNDataPreprocessor()
+    original = np.array([[1, 5, 2], [3, 5, 4], [2, 5, 9]], dtype=np.float32)
+
+    normalized = processor.normalize_features(original.copy(), "features")
+    np.testing.assert_allclose(processor.denormalize_features(normalized, "features"), original)
+
+    # A constant column maps back to its value whatever the normalized input
+    normalized[:, 1] = 0.5
+    np.testing.assert_array_equal(processor.denormalize_features(normalized, "features")[:, 1], 5)
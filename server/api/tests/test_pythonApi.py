@@ -0,0 +1,110 @@
+import json
+import random
+
+import networkx as nx
+import pytest
+
+from api import pythonApi
+
+
+def random_dag(seed, n=40, p=0.15):
+    """Random DAG with distinct float weights, so the heaviest path is unique."""
+    rng = random.Random(seed)
+    nodes = list(range(n))
+    edges = [
+        {'source': u, 'target': v, 'weight': round(rng.uniform(0.5, 10), 6)}
+        for u in nodes for v in nodes[u + 1:] if rng.random() < p
+    ]
+    return nodes, edges
+
+
+def networkx_command(monkeypatch, command, *args):
+    """Run a graph command through its networkx implementation."""
+    monkeypatch.setattr(pythonApi, 'fast_critical_path', lambda *a: None)
+    monkeypatch.setattr(pythonApi, 'fast_cascade_impact', lambda *a: None)
+    return command([json.dumps(arg) for arg in args])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_critical_path_backends_agree(monkeypatch, seed):
+    nodes, edges = random_dag(seed)
+    expected = networkx_command(monkeypatch, pythonApi.find_critical_path, nodes, edges)
+    assert len(expected['path']) > 1
+
+    backends = [pythonApi.csr_critical_path]
+    if pythonApi.RUSTWORKX_AVAILABLE:
+        backends.append(pythonApi.rx_critical_path)
+    for backend in backends:
+        path, weight = backend(nodes, edges)
+        assert path == expected['path']
+        assert weight == pytest.approx(expected['totalWeight'])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cascade_impact_backends_agree(monkeypatch, seed):
+    nodes, edges = random_dag(seed)
+    expected = networkx_command(monkeypatch, pythonApi.calculate_cascade_impact, 0, nodes, edges)
+
+    backends = [pythonApi.csr_cascade_impact]
+    if pythonApi.RUSTWORKX_AVAILABLE:
+        backends.append(pythonApi.rx_cascade_impact)
+    for backend in backends:
+        affected_items, total_delay = backend(0, nodes, edges)
+        assert sorted(affected_items) == sorted(expected['affected_items'])
+        assert total_delay == pytest.approx(expected['total_delay'])
+
+
+def test_csr_longest_paths_match_networkx():
+    nodes, edges = random_dag(7, n=200, p=0.05)
+    G = nx.DiGraph()
+    G.add_nodes_from(nodes)
+    G.add_weighted_edges_from((e['source'], e['target'], e['weight']) for e in edges)
+
+    graph = pythonApi.build_csr_graph(nodes, edges)
+    assert graph['is_dag']
+    # Every layer only depends on earlier layers
+    layer_of = {}
+    for layer, (start, end) in enumerate(zip(graph['layer_starts'][:-1], graph['layer_starts'][1:])):
+        for index in graph['order'][start:end]:
+            layer_of[graph['node_ids'][index]] = layer
+    assert all(layer_of[u] < layer_of[v] for u, v in G.edges)
+
+    path, weight = pythonApi.csr_critical_path(nodes, edges)
+    assert path == nx.dag_longest_path(G)
+    assert weight == pytest.approx(nx.dag_longest_path_length(G))
+
+
+def test_cyclic_graph_falls_back_to_networkx():
+    nodes = [1, 2, 3, 4]
+    edges = [
+        {'source': 1, 'target': 2, 'weight': 3},
+        {'source': 2, 'target': 3, 'weight': 4},
+        {'source': 3, 'target': 2, 'weight': 1},
+        {'source': 3, 'target': 4, 'weight': 2}
+    ]
+    assert pythonApi.csr_critical_path(nodes, edges) is None
+    if pythonApi.RUSTWORKX_AVAILABLE:
+        assert pythonApi.rx_critical_path(nodes, edges) is None
+
+    # The cheapest edge of the cycle (3 -> 2) is dropped
+    result = pythonApi.find_critical_path([json.dumps(nodes), json.dumps(edges)])
+    assert result == {'path': [1, 2, 3, 4], 'totalWeight': 9}
+
+
+MARKER_TEXTS = [
+    "This story depends on the login API. Nothing else to note.",
+    "Blocked by the database migration! It blocks the release and requires sign-off.",
+    "We are waiting for QA until Friday. Required by the mobile team? Yes.",
+    "Depends on the auth service. Depends on billing too. The blocker was removed",
+    "No dependencies mentioned here."
+]
+
+
+@pytest.mark.parametrize("text", MARKER_TEXTS)
+def test_regex_marker_sentences_match_spacy(monkeypatch, text):
+    spacy = pytest.importorskip("spacy")
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("sentencizer")
+    monkeypatch.setattr(pythonApi, 'marker_matcher', pythonApi.build_marker_matcher(pipeline))
+
+    assert pythonApi.text_marker_sentences(text) == pythonApi.doc_marker_sentences(pipeline(text))
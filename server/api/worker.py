@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import sys
+import json
+import traceback
+from contextlib import redirect_stdout
+
+# orjson encodes and parses worker messages and payloads faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+
+"""
+This module holds the long-lived stdin worker loop shared by the Python entry
+points (pythonApi.py and pinn_model.py), together with the JSON helpers used
+to parse requests and encode responses.
+"""
+
+def encode_response(response):
+    """
+    Serialize a worker response as one newline-terminated line of UTF-8 JSON.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # Types orjson does not know; let the json module try
+            pass
+    return (json.dumps(response) + "\n").encode()
+
+def write_response(response):
+    """
+    Write one response to stdout as a single JSON line and flush it.
+    """
+    sys.stdout.buffer.write(encode_response(response))
+    sys.stdout.buffer.flush()
+
+def serve(run_command):
+    """
+    Serve commands from stdin as a long-lived worker.
+    
+    Each input line is a JSON request {"id", "command", "args"} and each output
+    line is the matching {"id", "result"} response, so models, spaCy and torch
+    are loaded once per worker instead of once per request. Handler output on
+    stdout is redirected to stderr to keep the response stream clean.
+    
+    Args:
+        run_command: Function (command, args) -> result dictionary
+    """
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json_loads(line)
+            request_id = request.get("id")
+            with redirect_stdout(sys.stderr):
+                result = run_command(request["command"], request.get("args", []))
+            response = encode_response({"id": request_id, "result": result})
+        except Exception as e:
+            traceback.print_exc()
+            response = encode_response({"id": request_id, "result": {"error": str(e)}})
+        sys.stdout.buffer.write(response)
+        sys.stdout.buffer.flush()
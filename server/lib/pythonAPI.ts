@@ -1,4 +1,4 @@
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
 import path from 'path';
 import { WorkItem, Dependency } from '@shared/schema';
 
@@ -72,10 +72,23 @@ interface PINNOptions {
   lightweight?: boolean;
 }
 
+interface NLPOptions {
+  needEntities?: boolean;
+}
+
+interface PendingRequest {
+  command: string;
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+}
+
 class PythonAPI {
   private pythonPath: string;
   private scriptPath: string;
   private pinnModelAvailable: boolean;
+  private worker: ChildProcessWithoutNullStreams | null = null;
+  private pendingRequests = new Map<number, PendingRequest>();
+  private nextRequestId = 1;
 
   constructor() {
     // Use system Python or a specific path
@@ -86,58 +99,98 @@ class PythonAPI {
     this.pinnModelAvailable = false;
   }
 
-  // Call Python script with specific command and arguments
-  private async callPython(command: string, args: any[]): Promise<any> {
-    return new Promise((resolve, reject) => {
-      // Prepare arguments for Python script
-      const scriptArgs = [this.scriptPath, command, ...args.map(arg => JSON.stringify(arg))];
-      
-      // Spawn Python process
-      const pythonProcess = spawn(this.pythonPath, scriptArgs);
-      
-      let outputData = '';
-      let errorData = '';
-      
-      // Collect stdout data
-      pythonProcess.stdout.on('data', (data) => {
-        outputData += data.toString();
-      });
-      
-      // Collect stderr data
-      pythonProcess.stderr.on('data', (data) => {
-        errorData += data.toString();
+  // Start (or reuse) the long-lived Python worker that serves commands over stdin
+  private getWorker(): ChildProcessWithoutNullStreams {
+    if (this.worker) {
+      return this.worker;
+    }
+    
+    const worker = spawn(this.pythonPath, [this.scriptPath, '--serve']);
+    let outputBuffer = '';
+    
+    // Decode the streams as UTF-8 across chunk boundaries, so a multi-byte
+    // character split between two chunks is not mangled
+    worker.stdout.setEncoding('utf8');
+    worker.stderr.setEncoding('utf8');
+    
+    // Responses are newline-delimited JSON objects tagged with the request id
+    worker.stdout.on('data', (data: string) => {
+      outputBuffer += data;
+      let newline: number;
+      while ((newline = outputBuffer.indexOf('\n')) >= 0) {
+        const line = outputBuffer.slice(0, newline);
+        outputBuffer = outputBuffer.slice(newline + 1);
+        if (!line.trim()) continue;
         
-        // Check if PINN is available based on error messages
-        if (command === 'train_pinn_model' && errorData.includes('PINN dependencies not available')) {
-          this.pinnModelAvailable = false;
+        let response: { id: number, result: any };
+        try {
+          response = JSON.parse(line);
+        } catch (error) {
+          console.error(`Failed to parse Python output: ${error.message}`);
+          continue;
         }
-      });
-      
-      // Handle process completion
-      pythonProcess.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process exited with code ${code}: ${errorData}`));
-        } else {
-          try {
-            const result = JSON.parse(outputData);
-            
-            // If a PINN command succeeds, mark PINN as available
-            if (['train_pinn_model', 'predict_pinn_risk', 'quantize_model'].includes(command) && 
-                result.success !== false) {
-              this.pinnModelAvailable = true;
-            }
-            
-            resolve(result);
-          } catch (error) {
-            reject(new Error(`Failed to parse Python output: ${error.message}`));
-          }
+        
+        const pending = this.pendingRequests.get(response.id);
+        if (!pending) continue;
+        this.pendingRequests.delete(response.id);
+        
+        // If a PINN command succeeds, mark PINN as available
+        if (['train_pinn_model', 'predict_pinn_risk', 'quantize_model'].includes(pending.command) && 
+            response.result.success !== false) {
+          this.pinnModelAvailable = true;
         }
-      });
+        
+        pending.resolve(response.result);
+      }
+    });
+    
+    // Forward worker logs and check if PINN is available based on error messages
+    worker.stderr.on('data', (data: string) => {
+      const errorData = data;
+      if (errorData.includes('PINN dependencies not available')) {
+        this.pinnModelAvailable = false;
+      }
+      console.error(errorData);
+    });
+    
+    // Fail all in-flight requests if the worker dies; the next call respawns it
+    const failPending = (error: Error) => {
+      if (this.worker !== worker) return;
+      this.worker = null;
+      this.pendingRequests.forEach(pending => pending.reject(error));
+      this.pendingRequests.clear();
+    };
+    
+    worker.on('close', (code) => {
+      failPending(new Error(`Python process exited with code ${code}`));
+    });
+    
+    worker.on('error', (error) => {
+      failPending(new Error(`Failed to start Python process: ${error.message}`));
+    });
+    
+    worker.stdin.on('error', (error) => {
+      failPending(new Error(`Failed to write to Python process: ${error.message}`));
+    });
+    
+    this.worker = worker;
+    return worker;
+  }
+
+  // Call Python worker with specific command and arguments
+  private async callPython(command: string, args: any[]): Promise<any> {
+    return new Promise((resolve, reject) => {
+      const worker = this.getWorker();
+      const id = this.nextRequestId++;
+      this.pendingRequests.set(id, { command, resolve, reject });
       
-      // Handle process errors
-      pythonProcess.on('error', (error) => {
-        reject(new Error(`Failed to start Python process: ${error.message}`));
-      });
+      // Arguments stay JSON-encoded individually, as on the command line
+      const request = {
+        id,
+        command,
+        args: args.map(arg => JSON.stringify(arg))
+      };
+      worker.stdin.write(JSON.stringify(request) + '\n');
     });
   }
 
@@ -152,10 +205,34 @@ class PythonAPI {
     }
   }
 
+  // Predict risk for many factor sets in one request with the traditional model
+  async predictRiskBatch(factorsList: RiskFactors[]): Promise<number[]> {
+    try {
+      const result = await this.callPython('predict_risk_batch', [factorsList]);
+      return result.risk;
+    } catch (error) {
+      console.error('Error calling predict_risk_batch:', error);
+      throw error;
+    }
+  }
+
+  // Predict risk for many factor sets in one PINN forward pass
+  async predictRiskPINNBatch(factorsList: RiskFactors[]): Promise<RiskPredictionResult[]> {
+    try {
+      const result = await this.callPython('predict_risk_pinn_batch', [factorsList]);
+      return result.results;
+    } catch (error) {
+      console.error('Error calling predict_risk_pinn_batch:', error);
+      throw error;
+    }
+  }
+
   // Analyze text for dependencies using NLP & physics-enhanced models
-  async analyzeDependency(text: string): Promise<DependencyAnalysisResult> {
+  async analyzeDependency(text: string, options?: NLPOptions): Promise<DependencyAnalysisResult> {
     try {
-      const result = await this.callPython('analyze_dependency', [text]);
+      const args: any[] = [text];
+      if (options) args.push(options);
+      const result = await this.callPython('analyze_dependency', args);
       return result;
     } catch (error) {
       console.error('Error calling analyze_dependency:', error);
@@ -163,6 +240,19 @@ class PythonAPI {
     }
   }
 
+  // Analyze several texts in one request, batched through the NLP pipeline
+  async analyzeDependencies(texts: string[], options?: NLPOptions): Promise<DependencyAnalysisResult[]> {
+    try {
+      const args: any[] = [texts];
+      if (options) args.push(options);
+      const result = await this.callPython('analyze_dependency_batch', args);
+      return result.results;
+    } catch (error) {
+      console.error('Error calling analyze_dependency_batch:', error);
+      throw error;
+    }
+  }
+
   // Find critical path in dependency network using NetworkX & physics-enhancement
   async findCriticalPath(
     nodes: number[], 